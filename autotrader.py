@@ -1,17 +1,25 @@
-import json
+import contextlib
 import logging
 import os
 import re
+import signal
+import threading
 import time
 from dataclasses import dataclass
 from datetime import datetime, date
+from operator import attrgetter
 from pathlib import Path
-from typing import List, Dict, Optional, Set
+from typing import List, Dict, Optional, Set, Tuple
 from zoneinfo import ZoneInfo
 
+import orjson
+
 from ev import Bet
 from kalshi.kalshi_client import KalshiClient
 
+_TZ_RE = re.compile(r"\b(ET|CT|MT|PT|EST|CST|MST|PST)\b")
+_WS_RE = re.compile(r"\s+")
+
 
 @dataclass
 class AutotradeConfig:
@@ -53,8 +61,15 @@ class AutoTrader:
         self.schedule_tz = ZoneInfo(config.schedule_timezone)
         self.logger = logging.getLogger(__name__)
         self.state_path = Path(config.state_file)
+        self.journal_path = self.state_path.with_suffix(".jsonl")
         self.kill_switch_path = Path(config.kill_switch_file)
+        # The environment cannot change from outside a running process, so read it once.
+        self._kill_env = os.getenv("AUTOTRADER_KILL_SWITCH", "").strip().lower() in {"1", "true", "on", "yes"}
         self.state = self._load_state()
+        # Pinned for the duration of a trade_best_edges run; None means "compute now".
+        self._run_day: Optional[str] = None
+        self._run_bucket: Optional[Dict] = None
+        self._stop_event = threading.Event()
 
     def validate_live_trading_readiness(self) -> bool:
         if self._kill_switch_enabled():
@@ -64,66 +79,179 @@ class AutoTrader:
             return False
         return True
 
+    def stop(self) -> None:
+        """Interrupt a pending tipoff wait so maker orders are canceled immediately."""
+        self._stop_event.set()
+
+    @contextlib.contextmanager
+    def _stop_on_signals(self):
+        # Ctrl-C or a SIGTERM during the tipoff wait should still cancel resting maker
+        # orders, so route both to stop() and put the previous handlers back afterwards.
+        if threading.current_thread() is not threading.main_thread():
+            yield
+            return
+        handler = lambda signum, frame: self.stop()
+        previous = {sig: signal.signal(sig, handler) for sig in (signal.SIGINT, signal.SIGTERM)}
+        try:
+            yield
+        finally:
+            for sig, old in previous.items():
+                signal.signal(sig, old)
+
     def _kill_switch_enabled(self) -> bool:
-        env_value = os.getenv("AUTOTRADER_KILL_SWITCH", "").strip().lower()
-        if env_value in {"1", "true", "on", "yes"}:
-            return True
-        return self.kill_switch_path.exists()
+        return self._kill_env or self.kill_switch_path.exists()
 
     def _today_key(self) -> str:
+        if self._run_day is not None:
+            return self._run_day
         return datetime.now(self.tz).date().isoformat()
 
     def _load_state(self) -> Dict:
-        if not self.state_path.exists():
-            return {"by_date": {}}
-        try:
-            with open(self.state_path, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except Exception:
-            return {"by_date": {}}
-
-    def _save_state(self) -> None:
-        self.state_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.state_path, "w", encoding="utf-8") as f:
-            json.dump(self.state, f, indent=2)
+        # The state JSON holds completed days; the journal holds orders appended since.
+        state: Dict = {"by_date": {}}
+        if self.state_path.exists():
+            try:
+                state = orjson.loads(self.state_path.read_bytes())
+            except Exception:
+                state = {"by_date": {}}
+
+        # Days up to this one are already folded into the state file; a crash between
+        # writing it and rewriting the journal must not count their orders twice.
+        compacted_through = state.get("journal_compacted_through", "")
+        # Called before _run_day exists, so ask the clock directly.
+        today = datetime.now(self.tz).date().isoformat()
+        open_lines: List[bytes] = []
+        open_records: List[Tuple[str, Dict]] = []
+        completed_day = ""
+        if self.journal_path.exists():
+            with open(self.journal_path, "rb") as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        record = orjson.loads(line)
+                    except ValueError:
+                        # A torn final line from an interrupted write is skipped.
+                        continue
+                    day = record.pop("date", None)
+                    if not day or day <= compacted_through:
+                        continue
+                    if day >= today:
+                        open_lines.append(line)
+                        open_records.append((day, record))
+                        continue
+                    self._apply_order(self._bucket_for(state, day), record)
+                    completed_day = max(completed_day, day)
+
+        if completed_day:
+            # Fold finished days into the state file so each start only replays today.
+            state["journal_compacted_through"] = completed_day
+            try:
+                self._write_atomic(self.state_path, orjson.dumps(state))
+                self._write_atomic(self.journal_path, b"".join(line + b"\n" for line in open_lines))
+            except OSError as e:
+                # State in memory is complete either way; the next start retries.
+                self.logger.warning("Could not compact order journal: %s", e)
+
+        for day, record in open_records:
+            self._apply_order(self._bucket_for(state, day), record)
+        return state
+
+    @staticmethod
+    def _write_atomic(path: Path, data: bytes) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + ".tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+
+    def _append_journal(self, record: Dict) -> None:
+        self.journal_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.journal_path, "ab") as f:
+            f.write(orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE))
+
+    @staticmethod
+    def _new_bucket() -> Dict:
+        return {
+            "submitted_ids": [],
+            "orders": [],
+            "notional_total": 0.0,
+            "notional_by_ticker": {},
+        }
+
+    def _bucket_for(self, state: Dict, day: str) -> Dict:
+        by_date = state.setdefault("by_date", {})
+        bucket = by_date.get(day)
+        if bucket is None:
+            bucket = by_date[day] = self._new_bucket()
+        elif "notional_total" not in bucket:
+            self._migrate_bucket_totals(bucket)
+        return bucket
 
     def _daily_bucket(self) -> Dict:
-        today = self._today_key()
-        by_date = self.state.setdefault("by_date", {})
-        return by_date.setdefault(today, {"submitted_ids": [], "orders": []})
+        if self._run_bucket is not None:
+            return self._run_bucket
+        return self._bucket_for(self.state, self._today_key())
+
+    @staticmethod
+    def _migrate_bucket_totals(bucket: Dict) -> None:
+        """Backfill running notional totals for state saved before they existed."""
+        total = 0.0
+        by_ticker: Dict[str, float] = {}
+        for o in bucket.get("orders", []):
+            notional = float(o.get("notional", 0.0))
+            total += notional
+            ticker = o.get("ticker")
+            by_ticker[ticker] = by_ticker.get(ticker, 0.0) + notional
+        bucket["notional_total"] = total
+        bucket["notional_by_ticker"] = by_ticker
+
+    @staticmethod
+    def _apply_order(bucket: Dict, record: Dict) -> None:
+        notional = float(record.get("notional", 0.0))
+        bucket.setdefault("submitted_ids", []).append(record["client_order_id"])
+        ids_set = bucket.get("_submitted_ids_set")
+        if ids_set is not None:
+            ids_set.add(record["client_order_id"])
+        bucket.setdefault("orders", []).append(record)
+        bucket["notional_total"] += notional
+        by_ticker = bucket["notional_by_ticker"]
+        by_ticker[record["ticker"]] = by_ticker.get(record["ticker"], 0.0) + notional
 
     def _submitted_ids(self) -> Set[str]:
-        return set(self._daily_bucket().get("submitted_ids", []))
+        # In-memory only: built once per bucket from the list, then kept current by _apply_order.
+        bucket = self._daily_bucket()
+        ids_set = bucket.get("_submitted_ids_set")
+        if ids_set is None:
+            ids_set = bucket["_submitted_ids_set"] = set(bucket.get("submitted_ids", []))
+        return ids_set
 
     def _record_order(self, order: PlacedOrder) -> None:
-        bucket = self._daily_bucket()
-        bucket.setdefault("submitted_ids", []).append(order.client_order_id)
-        bucket.setdefault("orders", []).append(
-            {
-                "ticker": order.ticker,
-                "team_name": order.team_name,
-                "side": order.side,
-                "action": order.action,
-                "count": order.count,
-                "yes_price": order.yes_price,
-                "post_only": order.post_only,
-                "client_order_id": order.client_order_id,
-                "order_id": order.order_id,
-                "notional": order.notional,
-                "ts": int(time.time()),
-            }
-        )
-        self._save_state()
+        today = self._today_key()
+        record = {
+            "ticker": order.ticker,
+            "team_name": order.team_name,
+            "side": order.side,
+            "action": order.action,
+            "count": order.count,
+            "yes_price": order.yes_price,
+            "post_only": order.post_only,
+            "client_order_id": order.client_order_id,
+            "order_id": order.order_id,
+            "notional": order.notional,
+            "ts": int(time.time()),
+        }
+        self._apply_order(self._daily_bucket(), record)
+        self._append_journal({"date": today, **record})
 
     def _daily_notional(self) -> float:
-        return sum(float(o.get("notional", 0.0)) for o in self._daily_bucket().get("orders", []))
+        return self._daily_bucket()["notional_total"]
 
     def _market_notional(self, ticker: str) -> float:
-        total = 0.0
-        for o in self._daily_bucket().get("orders", []):
-            if o.get("ticker") == ticker:
-                total += float(o.get("notional", 0.0))
-        return total
+        return self._daily_bucket()["notional_by_ticker"].get(ticker, 0.0)
 
     def _quarter_kelly_contracts(self, model_prob: float, price: float) -> int:
         if price <= 0 or price >= 1:
@@ -141,7 +269,10 @@ class AutoTrader:
         return round(p, 2)
 
     def _taker_price(self, ticker: str) -> float:
-        prices = self.client.get_market_prices(ticker)
+        return self._taker_price_from(self.client.get_market_prices(ticker))
+
+    @staticmethod
+    def _taker_price_from(prices: Dict) -> float:
         yes_ask = float(prices.get("yes_buy_price", 0.0) or 0.0)
         if yes_ask > 0:
             return yes_ask
@@ -160,12 +291,21 @@ class AutoTrader:
         return True
 
     def trade_best_edges(self, bets: List[Bet], live_orders: bool = False) -> Dict[str, List[PlacedOrder]]:
+        self._run_day = self._today_key()
+        self._run_bucket = self._bucket_for(self.state, self._run_day)
+        try:
+            return self._trade_best_edges(bets, live_orders)
+        finally:
+            self._run_day = None
+            self._run_bucket = None
+
+    def _trade_best_edges(self, bets: List[Bet], live_orders: bool) -> Dict[str, List[PlacedOrder]]:
         if self._kill_switch_enabled():
             self.logger.warning("Kill switch is on; skipping autotrader execution")
             return {"taker": [], "maker": []}
 
         candidates = [b for b in bets if b.ev >= self.config.min_edge and b.contract_ticker]
-        candidates.sort(key=lambda b: b.ev, reverse=True)
+        candidates.sort(key=attrgetter("ev"), reverse=True)
         self.logger.info(
             "Autotrader: %d candidates with edge >= %.1f%%",
             len(candidates),
@@ -175,11 +315,15 @@ class AutoTrader:
         existing_ids = self._submitted_ids()
         open_ids = set()
         if live_orders:
-            for o in self.client.get_open_orders():
+            # Idempotency ids are "<mode>-<day>-...", so only today's orders can collide.
+            today_tag = f"-{self._today_key()}-"
+            for o in self.client.iter_open_orders():
                 cid = o.get("client_order_id")
-                if cid:
+                if cid and today_tag in cid:
                     open_ids.add(cid)
 
+        prices_map = self.client.get_market_prices_batch([b.contract_ticker for b in candidates])
+
         taker_orders: List[PlacedOrder] = []
         maker_orders: List[PlacedOrder] = []
         placed_count = 0
@@ -188,7 +332,7 @@ class AutoTrader:
             if placed_count >= self.config.max_orders_per_run:
                 break
 
-            taker_price = self._taker_price(bet.contract_ticker)
+            taker_price = self._taker_price_from(prices_map.get(bet.contract_ticker, {}))
             model_prob = float(bet.model_prob_or_exp_payout)
 
             post_only = False
@@ -331,18 +475,27 @@ class AutoTrader:
                 wait_seconds,
                 first_tipoff.isoformat(),
             )
-            while wait_seconds > 0:
-                sleep_for = min(wait_seconds, self.config.poll_seconds)
-                time.sleep(sleep_for)
-                wait_seconds -= sleep_for
+            deadline = first_tipoff.timestamp()
+            with self._stop_on_signals():
+                while True:
+                    remaining = deadline - time.time()
+                    if remaining <= 0:
+                        break
+                    if self._stop_event.wait(min(self.config.poll_seconds, remaining)):
+                        self.logger.info("Stop requested; canceling maker orders before tipoff")
+                        break
+                    if self._kill_switch_enabled():
+                        self.logger.warning("Kill switch is on; canceling maker orders before tipoff")
+                        break
 
         order_ids: List[str] = [o.order_id for o in maker_orders if o.order_id]
         if live_orders and not order_ids:
             # Fallback: cancel any live maker orders opened earlier today by this strategy.
-            for o in self.client.get_open_orders():
-                cid = o.get("client_order_id", "")
+            maker_prefix = f"mm-{self._today_key()}-"
+            for o in self.client.iter_open_orders():
+                cid = o.get("client_order_id") or ""
                 oid = o.get("order_id")
-                if cid.startswith("mm-") and self._today_key() in cid and oid:
+                if oid and cid.startswith(maker_prefix):
                     order_ids.append(oid)
 
         canceled = 0
@@ -358,12 +511,13 @@ class AutoTrader:
 
     def _parse_tipoff_text(self, text: str) -> Optional[datetime]:
         cleaned = text.strip().upper()
-        cleaned = re.sub(r"\b(ET|CT|MT|PT|EST|CST|MST|PST)\b", "", cleaned).strip()
-        cleaned = re.sub(r"\s+", " ", cleaned)
+        cleaned = _TZ_RE.sub("", cleaned).strip()
+        cleaned = _WS_RE.sub(" ", cleaned)
+        today = datetime.now(self.schedule_tz).date()
         for fmt in ("%I:%M %p", "%I %p"):
             try:
                 t = datetime.strptime(cleaned, fmt).time()
-                return datetime.combine(datetime.now(self.schedule_tz).date(), t, self.schedule_tz)
+                return datetime.combine(today, t, self.schedule_tz)
             except ValueError:
                 continue
         return None
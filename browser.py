@@ -1,16 +1,37 @@
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, WebDriverException
-import chromedriver_autoinstaller
-import time
 import logging
+import threading
 from pathlib import Path
-from typing import Optional
+from types import SimpleNamespace
+from typing import List, Optional, Tuple
 
 class BrowserClient:
+    # Selenium and chromedriver_autoinstaller are imported on first use so that
+    # importing this module stays cheap for callers that never open a browser.
+    _sel: Optional[SimpleNamespace] = None
+
+    @classmethod
+    def _ensure_imports(cls) -> SimpleNamespace:
+        if cls._sel is None:
+            from selenium import webdriver
+            from selenium.webdriver.chrome.options import Options
+            from selenium.webdriver.common.by import By
+            from selenium.webdriver.support.ui import WebDriverWait
+            from selenium.webdriver.support import expected_conditions as EC
+            from selenium.common.exceptions import TimeoutException, WebDriverException
+            import chromedriver_autoinstaller
+
+            cls._sel = SimpleNamespace(
+                webdriver=webdriver,
+                Options=Options,
+                By=By,
+                WebDriverWait=WebDriverWait,
+                EC=EC,
+                TimeoutException=TimeoutException,
+                WebDriverException=WebDriverException,
+                chromedriver_autoinstaller=chromedriver_autoinstaller,
+            )
+        return cls._sel
+
     def __init__(self, headless: bool = True, timeout: int = 30, screenshot_dir: Optional[Path] = None):
         self.headless = headless
         self.timeout = timeout
@@ -20,11 +41,12 @@ class BrowserClient:
     
     def start(self):
         """Start the browser session"""
+        sel = self._ensure_imports()
         try:
             # Install correct ChromeDriver automatically
-            chromedriver_autoinstaller.install()
+            sel.chromedriver_autoinstaller.install()
             
-            chrome_options = Options()
+            chrome_options = sel.Options()
             if self.headless:
                 chrome_options.add_argument("--headless")
             chrome_options.add_argument("--no-sandbox")
@@ -32,7 +54,7 @@ class BrowserClient:
             chrome_options.add_argument("--disable-gpu")
             chrome_options.add_argument("--window-size=1920,1080")
             
-            self.driver = webdriver.Chrome(options=chrome_options)
+            self.driver = sel.webdriver.Chrome(options=chrome_options)
             self.driver.set_page_load_timeout(self.timeout)
             
             self.logger.info("Browser started successfully")
@@ -48,26 +70,30 @@ class BrowserClient:
             self.driver = None
             self.logger.info("Browser stopped")
     
-    def get_page(self, url: str, wait_time: int = 3) -> bool:
-        """Navigate to a URL and wait for page to load"""
+    def get_page(self, url: str, wait_for: Optional[Tuple[str, str]] = None) -> bool:
+        """Navigate to a URL and wait for `wait_for` (a (By, value) locator), defaulting to <body>"""
+        sel = self._ensure_imports()
+        if self.driver is None:
+            # Started on first use, so callers that never need a page never launch Chrome
+            self.start()
         try:
             self.logger.info(f"Loading page: {url}")
             self.driver.get(url)
-            time.sleep(wait_time)
             
             # Wait for page to be ready
-            WebDriverWait(self.driver, self.timeout).until(
-                EC.presence_of_element_located((By.TAG_NAME, "body"))
+            locator = wait_for or (sel.By.TAG_NAME, "body")
+            sel.WebDriverWait(self.driver, self.timeout).until(
+                sel.EC.presence_of_element_located(locator)
             )
             
             return True
             
-        except TimeoutException:
+        except sel.TimeoutException:
             self.logger.error(f"Timeout loading page: {url}")
             if self.screenshot_dir:
                 self.save_screenshot(f"timeout_{url.replace('/', '_')}")
             return False
-        except WebDriverException as e:
+        except sel.WebDriverException as e:
             self.logger.error(f"WebDriver error loading {url}: {e}")
             if self.screenshot_dir:
                 self.save_screenshot(f"error_{url.replace('/', '_')}")
@@ -81,25 +107,47 @@ class BrowserClient:
             self.driver.save_screenshot(str(screenshot_path))
             self.logger.info(f"Screenshot saved: {screenshot_path}")
     
-    def find_elements(self, by: By, value: str, timeout: int = 10):
+    def find_elements(self, by: str, value: str, timeout: int = 10):
         """Find elements with timeout"""
+        sel = self._ensure_imports()
         try:
-            WebDriverWait(self.driver, timeout).until(
-                EC.presence_of_element_located((by, value))
+            sel.WebDriverWait(self.driver, timeout).until(
+                sel.EC.presence_of_element_located((by, value))
             )
             return self.driver.find_elements(by, value)
-        except TimeoutException:
+        except sel.TimeoutException:
             self.logger.warning(f"Elements not found: {by}={value}")
             return []
     
-    def find_element(self, by: By, value: str, timeout: int = 10):
+    # Collects every row's <th> and <td> texts in the page, so a table costs one
+    # WebDriver round-trip instead of one per row and per cell.
+    _TABLE_ROWS_JS = (
+        "return Array.from(document.querySelectorAll(arguments[0])).map(r => ["
+        "Array.from(r.querySelectorAll('th')).map(c => c.innerText.trim()),"
+        "Array.from(r.querySelectorAll('td')).map(c => c.innerText.trim())]);"
+    )
+
+    def table_rows(self, selector: str = "table tr", timeout: int = 10) -> List[Tuple[List[str], List[str]]]:
+        """Return (header texts, cell texts) for each row matching a CSS selector"""
+        sel = self._ensure_imports()
+        try:
+            sel.WebDriverWait(self.driver, timeout).until(
+                sel.EC.presence_of_element_located((sel.By.CSS_SELECTOR, selector))
+            )
+        except sel.TimeoutException:
+            self.logger.warning(f"Rows not found: {selector}")
+            return []
+        return [(th, td) for th, td in self.driver.execute_script(self._TABLE_ROWS_JS, selector)]
+
+    def find_element(self, by: str, value: str, timeout: int = 10):
         """Find single element with timeout"""
+        sel = self._ensure_imports()
         try:
-            WebDriverWait(self.driver, timeout).until(
-                EC.presence_of_element_located((by, value))
+            sel.WebDriverWait(self.driver, timeout).until(
+                sel.EC.presence_of_element_located((by, value))
             )
             return self.driver.find_element(by, value)
-        except TimeoutException:
+        except sel.TimeoutException:
             self.logger.warning(f"Element not found: {by}={value}")
             return None
     
@@ -109,3 +157,41 @@ class BrowserClient:
     
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.stop()
+
+
+class BrowserPool:
+    """One BrowserClient per thread, started on its first page load and all stopped on close.
+
+    Selenium drivers must not be shared between threads, so concurrent scrapes
+    each get their own; the number of live browsers is bounded by the number of
+    threads that load a page through one.
+    """
+
+    def __init__(self, **browser_kwargs):
+        self.browser_kwargs = browser_kwargs
+        self._local = threading.local()
+        self._clients: List[BrowserClient] = []
+        self._lock = threading.Lock()
+
+    def get(self) -> BrowserClient:
+        """Return the calling thread's browser; it starts Chrome when it first loads a page"""
+        client = getattr(self._local, "client", None)
+        if client is None:
+            client = BrowserClient(**self.browser_kwargs)
+            self._local.client = client
+            with self._lock:
+                self._clients.append(client)
+        return client
+
+    def close(self):
+        """Stop every browser the pool started"""
+        with self._lock:
+            clients, self._clients = self._clients, []
+        for client in clients:
+            client.stop()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
@@ -1,20 +1,32 @@
 import yaml
 import os
+import copy
+import functools
 from pathlib import Path
 from typing import Dict, List, Any
 from datetime import datetime, timezone
 
+# libyaml's C loader is several times faster; fall back to the pure-Python one.
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@functools.lru_cache(maxsize=4)
+def _load_yaml(path: str) -> Any:
+    """Parse a YAML file once per process. Callers must copy before mutating."""
+    with open(path, 'r') as f:
+        return yaml.load(f, Loader=_YamlLoader)
+
+
 class Config:
     def __init__(self, config_path: str = None):
         if config_path is None:
             config_path = Path(__file__).parent / "config.yaml"
         
-        with open(config_path, 'r') as f:
-            self.config = yaml.safe_load(f)
+        # Copied because callers (e.g. main.py CLI overrides) mutate self.config.
+        self.config = copy.deepcopy(_load_yaml(str(config_path)))
         
         conference_map_path = Path(__file__).parent / "conference_map.yaml"
-        with open(conference_map_path, 'r') as f:
-            self.conference_map = yaml.safe_load(f)['conferences']
+        self.conference_map = dict(_load_yaml(str(conference_map_path))['conferences'])
     
     @property
     def scraping(self) -> Dict[str, Any]:
@@ -1,17 +1,35 @@
 import os
+import secrets
+import sys
+import asyncio
+import functools
+import hmac
+import hashlib
+import heapq
 import time
 import logging
 import threading
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from pathlib import Path
+from typing import Iterator, Optional, Tuple
 
-from fastapi import FastAPI, Depends, HTTPException, status, Query
+from fastapi import FastAPI, Depends, HTTPException, status, Query, Response
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
-from passlib.hash import pbkdf2_sha256
+from passlib.hash import argon2
 from pydantic import BaseModel
 import jwt
+import orjson
 import requests
+from rapidfuzz import fuzz, process
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from app.scraper import (
     scrape_tourneycast,
@@ -20,7 +38,7 @@ from app.scraper import (
     BARTTORVIK_CONF_CODES,
 )
 
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
 
 app.add_middleware(
     CORSMiddleware,
@@ -34,9 +52,39 @@ SECRET_KEY = os.getenv("JWT_SECRET", "barttorvik-dashboard-secret-key-2026")
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 720
 
-USERS_DB = {
-    "dylan": pbkdf2_sha256.hash("bart123#")
-}
+# argon2id at OWASP's minimum profile (19 MiB, t=2, p=1): ~24ms per verify on one
+# core, against ~119ms at 64 MiB. Hashes carry their own parameters, so a supplied
+# DYLAN_PASSWORD_HASH made with other settings still verifies.
+password_hasher = argon2.using(type="ID", rounds=2, memory_cost=19 * 1024, parallelism=1)
+
+DASHBOARD_USERS = ("dylan",)
+
+
+@functools.lru_cache(maxsize=1)
+def _users_db() -> dict:
+    # Hashed by the startup hook in the threadpool, not at import or on the first /token.
+    # DYLAN_PASSWORD_HASH lets a deployment supply a precomputed hash instead.
+    password_hash = os.getenv("DYLAN_PASSWORD_HASH") or password_hasher.hash(
+        os.getenv("DYLAN_PASSWORD", "bart123#")
+    )
+    return {"dylan": password_hash}
+
+LOGIN_CACHE_TTL = 300
+# Keys the Redis login cache. It must be a real secret kept apart from JWT_SECRET
+# (which has a public default); without it successful logins are not shared.
+LOGIN_CACHE_PEPPER = os.getenv("LOGIN_CACHE_PEPPER", "").encode("utf-8")
+# The in-process cache never leaves the worker, so a per-process random key is enough.
+_LOCAL_LOGIN_KEY = secrets.token_bytes(32)
+_verified_logins: dict = {}
+# login is a sync route, so verify_password runs on several threadpool workers at once.
+_verified_logins_lock = threading.Lock()
+
+JWT_CACHE_SIZE = 4096
+# Entries live until the token's exp or this many seconds, whichever comes first.
+JWT_CACHE_TTL = 30
+_jwt_cache: "OrderedDict[bytes, Tuple[str, float]]" = OrderedDict()
+# get_current_user is a sync dependency, so FastAPI calls it from worker threads.
+_jwt_cache_lock = threading.Lock()
 
 KALSHI_BASE_URL = os.getenv("KALSHI_BASE_URL", "https://api.kalshi.com/trade-api/v2")
 MAKE_TOURNAMENT_SERIES = "KXMAKEMARMAD"
@@ -72,6 +120,34 @@ TEAM_NAME_MAP = {
     "TCU": "Texas Christian",
 }
 
+# BT name -> Kalshi names that TEAM_NAME_MAP sends to it.
+_REVERSE_TEAM_NAME_MAP: dict = {}
+for _kalshi, _bt in TEAM_NAME_MAP.items():
+    _REVERSE_TEAM_NAME_MAP.setdefault(_bt, []).append(_kalshi)
+
+KALSHI_MAX_CONCURRENCY = 8
+SERIES_FETCH_WORKERS = 8
+
+_kalshi_session = requests.Session()
+_kalshi_session.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=32,
+        # Jittered backoff keeps parallel series fetches from retrying in lockstep;
+        # Retry-After on 429/503 is honored by default and takes precedence.
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.25,
+            backoff_jitter=0.25,
+            backoff_max=4.0,
+            status_forcelist=(429, 500, 502, 503, 504),
+        ),
+    ),
+)
+# Caps in-flight requests to Kalshi now that series are fetched in parallel.
+_kalshi_semaphore = threading.Semaphore(KALSHI_MAX_CONCURRENCY)
+
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO)
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
@@ -89,12 +165,66 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
 
 
+def _login_digest(key: bytes, username: str, password: str) -> bytes:
+    message = f"{username}\0{password}".encode("utf-8")
+    return hmac.new(key, message, hashlib.sha256).digest()
+
+
+def verify_password(username: str, password: str) -> bool:
+    password_hash = _users_db().get(username)
+    if not password_hash:
+        return False
+
+    # Dashboard clients log in repeatedly; skip the argon2 work for a recent success.
+    digest = _login_digest(_LOCAL_LOGIN_KEY, username, password)
+    now = time.time()
+    with _verified_logins_lock:
+        cached = _verified_logins.get(username)
+        if cached and cached[1] <= now:
+            del _verified_logins[username]
+            cached = None
+    if cached and hmac.compare_digest(cached[0], digest):
+        return True
+
+    # Other workers share recent successes through Redis when it is configured and
+    # peppered. The key embeds the peppered digest, never the password itself.
+    shared_key = None
+    if LOGIN_CACHE_PEPPER:
+        shared_digest = _login_digest(LOGIN_CACHE_PEPPER, username, password)
+        shared_key = f"auth:{username}:{shared_digest.hex()}"
+    shared = _shared_get(shared_key) if shared_key else None
+    if not (shared and shared[0]):
+        if not password_hasher.verify(password, password_hash):
+            return False
+        if shared_key:
+            _shared_set({shared_key: True}, LOGIN_CACHE_TTL)
+    with _verified_logins_lock:
+        _verified_logins[username] = (digest, time.time() + LOGIN_CACHE_TTL)
+    return True
+
+
 def get_current_user(token: str = Depends(oauth2_scheme)):
+    # The dashboard re-sends the same token on every poll; skip decoding it again.
+    token_key = hashlib.blake2b(token.encode("utf-8"), digest_size=16).digest()
+    with _jwt_cache_lock:
+        cached = _jwt_cache.get(token_key)
+        if cached and cached[1] > time.time():
+            _jwt_cache.move_to_end(token_key)
+            return cached[0]
+
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
         username: str = payload.get("sub")
-        if username is None or username not in USERS_DB:
+        if username is None or username not in DASHBOARD_USERS:
             raise HTTPException(status_code=401, detail="Invalid token")
+        exp = payload.get("exp")
+        if exp is not None:
+            valid_until = min(float(exp), time.time() + JWT_CACHE_TTL)
+            with _jwt_cache_lock:
+                _jwt_cache[token_key] = (username, valid_until)
+                _jwt_cache.move_to_end(token_key)
+                if len(_jwt_cache) > JWT_CACHE_SIZE:
+                    _jwt_cache.popitem(last=False)
         return username
     except jwt.ExpiredSignatureError:
         raise HTTPException(status_code=401, detail="Token expired")
@@ -102,27 +232,39 @@ def get_current_user(token: str = Depends(oauth2_scheme)):
         raise HTTPException(status_code=401, detail="Invalid token")
 
 
-def kalshi_get(path: str, params: Optional[dict] = None) -> Optional[dict]:
+def kalshi_get(
+    path: str,
+    params: Optional[dict] = None,
+    etag: Optional[str] = None,
+) -> Tuple[Optional[dict], Optional[str]]:
+    """
+    GET a Kalshi endpoint and return (data, etag). When `etag` is given it is
+    sent as If-None-Match; a 304 reply comes back as ({}, etag) with no body,
+    so callers must reuse the payload they stored alongside that etag.
+    """
+    # Retries and 429 backoff are handled by the session's HTTPAdapter.
     url = KALSHI_BASE_URL + path
-    max_retries = 3
-    for attempt in range(max_retries):
-        try:
-            resp = requests.get(url, params=params, timeout=30)
-            if resp.status_code == 429:
-                time.sleep(2 ** attempt)
-                continue
-            resp.raise_for_status()
-            return resp.json()
-        except requests.RequestException:
-            if attempt < max_retries - 1:
-                time.sleep(2 ** attempt)
-                continue
-            return None
-    return None
+    headers = {"If-None-Match": etag} if etag else None
+    try:
+        with _kalshi_semaphore:
+            resp = _kalshi_session.get(url, params=params, headers=headers, timeout=30)
+        if resp.status_code == 304:
+            return {}, etag
+        resp.raise_for_status()
+        return orjson.loads(resp.content), resp.headers.get("ETag")
+    except (requests.RequestException, orjson.JSONDecodeError):
+        return None, None
 
 
 def fetch_markets_by_series(series_ticker: str) -> list:
-    all_markets = []
+    return list(iter_markets_by_series(series_ticker))
+
+
+def iter_markets_by_series(series_ticker: str) -> Iterator[dict]:
+    """Yield a series' open markets page by page so callers can parse as pages arrive."""
+    # Per-series page store, rebuilt each pass so pages whose cursor disappeared are dropped.
+    stored_pages = _cache.setdefault("etags", {}).get(series_ticker, {})
+    visited_pages: dict = {}
     cursor = None
     seen_cursors = set()
     max_pages = 200
@@ -135,11 +277,17 @@ def fetch_markets_by_series(series_ticker: str) -> list:
         params = {"series_ticker": series_ticker, "status": "open", "limit": "200"}
         if cursor:
             params["cursor"] = cursor
-        data = kalshi_get("/markets", params=params)
+        # Each page is cached with its ETag so an unchanged page costs a 304, not a body.
+        stored_etag, stored_data = stored_pages.get(cursor, (None, None))
+        data, etag = kalshi_get("/markets", params=params, etag=stored_etag)
         if data is None:
             break
+        if stored_etag and etag == stored_etag and not data:
+            data = stored_data
+        if etag:
+            visited_pages[cursor] = (etag, data)
         markets = data.get("markets", [])
-        all_markets.extend(markets)
+        yield from markets
         next_cursor = data.get("cursor", "")
         if not next_cursor or not markets:
             break
@@ -148,115 +296,200 @@ def fetch_markets_by_series(series_ticker: str) -> list:
             break
         seen_cursors.add(next_cursor)
         cursor = next_cursor
-    return all_markets
+    _cache["etags"][series_ticker] = visited_pages
 
 
+_NORM_TABLE = str.maketrans({".": None, "'": None, "\u2019": None, "-": " "})
+
+
+@functools.lru_cache(maxsize=4096)
 def normalize_team_name(name: str) -> str:
-    name = name.strip()
-    name = name.replace(".", "").replace("'", "").replace("\u2019", "")
-    name = name.replace("-", " ").replace("  ", " ")
-    return name.lower().strip()
+    # split()/join collapses any whitespace run and trims both ends in one pass.
+    return " ".join(name.translate(_NORM_TABLE).lower().split())
 
 
-def match_team_name(kalshi_name: str, bt_teams: dict) -> Optional[str]:
-    if kalshi_name in bt_teams:
-        return kalshi_name
+# Minimum token_sort_ratio score for the fuzzy fallback once exact and alias lookups miss.
+FUZZY_MATCH_CUTOFF = 92
+# Tokens that name a different school rather than spell the same one differently
+# ("South Carolina" vs "North Carolina", "Kansas St" vs "Kansas").
+_DISTINGUISHING_TOKENS = frozenset({
+    "north", "south", "east", "west", "central",
+    "northern", "southern", "eastern", "western", "st", "state",
+})
 
-    mapped = TEAM_NAME_MAP.get(kalshi_name)
-    if mapped and mapped in bt_teams:
-        return mapped
 
+def build_name_index(bt_teams) -> dict:
+    """Map normalized BT names to the original name; the first name wins on collisions."""
+    by_norm: dict = {}
     for bt_name in bt_teams:
-        mapped_bt = TEAM_NAME_MAP.get(bt_name)
-        if mapped_bt and mapped_bt == kalshi_name:
-            return bt_name
+        by_norm.setdefault(normalize_team_name(bt_name), bt_name)
+    return {"by_norm": by_norm, "norm_keys": list(by_norm)}
+
+
+def _same_school_shape(a: str, b: str) -> bool:
+    """Fuzzy candidates must have as many tokens and the same distinguishing tokens."""
+    a_tokens = a.split()
+    b_tokens = b.split()
+    return (
+        len(a_tokens) == len(b_tokens)
+        and _DISTINGUISHING_TOKENS.intersection(a_tokens) == _DISTINGUISHING_TOKENS.intersection(b_tokens)
+    )
 
-    kalshi_norm = normalize_team_name(kalshi_name)
-    for bt_name in bt_teams:
-        bt_norm = normalize_team_name(bt_name)
-        if kalshi_norm == bt_norm:
-            return bt_name
-        if kalshi_norm in bt_norm or bt_norm in kalshi_norm:
-            return bt_name
 
+def _fuzzy_lookup(kalshi_norm: str, by_norm: dict, norm_keys: list):
+    # Best score first; the first candidate that passes the shape guard wins.
+    candidates = process.extract(
+        kalshi_norm, norm_keys, scorer=fuzz.token_sort_ratio,
+        score_cutoff=FUZZY_MATCH_CUTOFF, limit=None,
+    )
+    for norm_key, _, _ in candidates:
+        if _same_school_shape(kalshi_norm, norm_key):
+            return by_norm[norm_key]
     return None
 
 
-def match_conf_team(kalshi_name: str, conf_teams: list) -> Optional[dict]:
+def build_conf_index(conf_teams: list) -> dict:
+    by_name: dict = {}
+    by_norm: dict = {}
+    by_mapped_norm: dict = {}
     for t in conf_teams:
-        if t["team"] == kalshi_name:
-            return t
+        by_name.setdefault(t["team"], t)
+        by_norm.setdefault(normalize_team_name(t["team"]), t)
+        mapped_bt = TEAM_NAME_MAP.get(t["team"])
+        if mapped_bt:
+            by_mapped_norm.setdefault(normalize_team_name(mapped_bt), t)
+    return {
+        "by_name": by_name,
+        "by_norm": by_norm,
+        "by_mapped_norm": by_mapped_norm,
+        "norm_keys": list(by_norm),
+    }
+
+
+def match_team_name(kalshi_name: str, bt_teams: dict, norm_index: Optional[dict] = None) -> Optional[str]:
+    if kalshi_name in bt_teams:
+        return kalshi_name
 
     mapped = TEAM_NAME_MAP.get(kalshi_name)
-    if mapped:
-        for t in conf_teams:
-            if t["team"] == mapped:
-                return t
+    if mapped and mapped in bt_teams:
+        return mapped
 
+    for bt_name in _REVERSE_TEAM_NAME_MAP.get(kalshi_name, ()):
+        if bt_name in bt_teams:
+            return bt_name
+
+    if norm_index is None:
+        norm_index = build_name_index(bt_teams)
     kalshi_norm = normalize_team_name(kalshi_name)
-    for t in conf_teams:
-        bt_norm = normalize_team_name(t["team"])
-        if kalshi_norm == bt_norm:
-            return t
-        if kalshi_norm in bt_norm or bt_norm in kalshi_norm:
-            return t
+    hit = norm_index["by_norm"].get(kalshi_norm)
+    if hit is not None:
+        return hit
+    return _fuzzy_lookup(kalshi_norm, norm_index["by_norm"], norm_index["norm_keys"])
 
-    for t in conf_teams:
-        mapped_bt = TEAM_NAME_MAP.get(t["team"])
-        if mapped_bt and normalize_team_name(mapped_bt) == kalshi_norm:
-            return t
 
-    return None
+def match_conf_team(kalshi_name: str, conf_teams: list, index: Optional[dict] = None) -> Optional[dict]:
+    if index is None:
+        index = build_conf_index(conf_teams)
+    by_name = index["by_name"]
 
+    hit = by_name.get(kalshi_name)
+    if hit is not None:
+        return hit
 
-def parse_market(m: dict, market_type: str, conference: str) -> Optional[dict]:
-    team_name = m.get("yes_sub_title", "")
-    if not team_name:
-        parts = m.get("ticker", "").rsplit("-", 1)
-        if len(parts) == 2:
-            team_name = parts[1]
+    mapped = TEAM_NAME_MAP.get(kalshi_name)
+    if mapped and mapped in by_name:
+        return by_name[mapped]
+
+    kalshi_norm = normalize_team_name(kalshi_name)
+    hit = index["by_norm"].get(kalshi_norm)
+    if hit is not None:
+        return hit
+    hit = index["by_mapped_norm"].get(kalshi_norm)
+    if hit is not None:
+        return hit
+    return _fuzzy_lookup(kalshi_norm, index["by_norm"], index["norm_keys"])
+
+
+@dataclass(slots=True)
+class Market:
+    """A parsed Kalshi market; orjson serializes it with the same keys the API always had."""
+    team_name: str
+    ticker: str
+    market_type: str
+    conference: str
+    yes_price: float
+    no_price: float
+    yes_ask: float
+    no_ask: float
+    last_price: float
+    volume: int
+    implied_prob: float
+    bt_probability: float = 0.0
+    ev: float = 0.0
+    bt_source: str = ""
+    share_prob: float = 0.0
+    sole_prob: float = 0.0
+
+
+@dataclass(frozen=True, slots=True)
+class BetsSnapshot:
+    """One bets build, its derived views and the BT data behind it.
+
+    Installed into _cache as a single object and never mutated, so a handler that
+    got one from get_cached_bets can build its payload while a refresh replaces it.
+    """
+    bets: list
+    make_tourney: list
+    conference: list
+    conf_grouped: dict
+    derived: dict
+    bets_time: float
+    bt_tourney: dict
+    bt_conferences: dict
+    bt_schedule: list
+    bt_time: float
+
+
+def parse_series(series_ticker: str, market_type: str, conference: str) -> list:
+    """Fetch and parse one series; raw pages are dropped as soon as they are parsed."""
+    parsed_markets = []
+    for m in iter_markets_by_series(series_ticker):
+        parsed = parse_market(m, market_type, conference)
+        if parsed:
+            parsed_markets.append(parsed)
+    return parsed_markets
+
+
+def parse_market(m: dict, market_type: str, conference: str) -> Optional[Market]:
+    ticker = m.get("ticker", "")
+    team_name = m.get("yes_sub_title")
     if not team_name:
+        # Only parse the ticker suffix when Kalshi leaves the subtitle blank.
+        _, sep, suffix = ticker.rpartition("-")
+        team_name = suffix if sep else ""
+    if not team_name or not ticker:
         return None
 
-    yes_bid = _read_price(m, "yes_bid")
-    yes_ask = _read_price(m, "yes_ask")
-    no_bid = _read_price(m, "no_bid")
-    no_ask = _read_price(m, "no_ask")
-    last_price = _read_price(m, "last_price")
+    prices = _read_prices(m)
+    yes_bid, yes_ask, no_bid, no_ask, last_price = prices
     volume = m.get("volume", 0)
 
-    implied_prob = _derive_implied_prob(
-        yes_bid=yes_bid,
+    implied_prob = _derive_implied_prob(*prices)
+
+    return Market(
+        team_name=team_name,
+        ticker=ticker,
+        market_type=market_type,
+        conference=conference,
+        yes_price=yes_bid,
+        no_price=no_bid,
         yes_ask=yes_ask,
-        no_bid=no_bid,
         no_ask=no_ask,
         last_price=last_price,
+        volume=volume,
+        implied_prob=round(implied_prob, 4),
     )
 
-    return {
-        "team_name": team_name,
-        "ticker": m["ticker"],
-        "market_type": market_type,
-        "conference": conference,
-        "yes_price": yes_bid,
-        "no_price": no_bid,
-        "yes_ask": yes_ask,
-        "no_ask": no_ask,
-        "last_price": last_price,
-        "volume": volume,
-        "implied_prob": round(implied_prob, 4),
-        "bt_probability": 0.0,
-        "ev": 0.0,
-        "bt_source": "",
-        "share_prob": 0.0,
-        "sole_prob": 0.0,
-    }
-
-
-def _is_informative_quote(value: float) -> bool:
-    # 0 and 1 are often placeholders for "no real quote" on Kalshi snapshots.
-    return 0.0 < value < 1.0
-
 
 def _derive_implied_prob(
     yes_bid: float,
@@ -265,64 +498,81 @@ def _derive_implied_prob(
     no_ask: float,
     last_price: float,
 ) -> float:
+    # Inputs come from _read_price and are already clamped to [0, 1], so only the
+    # "informative" test remains: 0 and 1 are often placeholders for "no real quote".
+    yes_bid_ok = 0.0 < yes_bid < 1.0
+    yes_ask_ok = 0.0 < yes_ask < 1.0
+
     # Prefer YES-side direct quotes only when they are informative.
-    if _is_informative_quote(yes_bid) and _is_informative_quote(yes_ask):
-        return max(0.0, min(1.0, (yes_bid + yes_ask) / 2.0))
-    if _is_informative_quote(yes_ask):
-        return max(0.0, min(1.0, yes_ask))
-    if _is_informative_quote(yes_bid):
-        return max(0.0, min(1.0, yes_bid))
+    if yes_ask_ok:
+        return (yes_bid + yes_ask) / 2.0 if yes_bid_ok else yes_ask
+    if yes_bid_ok:
+        return yes_bid
 
     # Fall back to last trade if informative.
-    if _is_informative_quote(last_price):
-        return max(0.0, min(1.0, last_price))
+    if 0.0 < last_price < 1.0:
+        return last_price
 
     # Infer YES from NO-side quotes only when NO quotes are informative.
-    inv_quotes = []
-    if _is_informative_quote(no_bid):
-        inv_quotes.append(1.0 - no_bid)
-    if _is_informative_quote(no_ask):
-        inv_quotes.append(1.0 - no_ask)
-    if inv_quotes:
-        return max(0.0, min(1.0, sum(inv_quotes) / len(inv_quotes)))
+    no_bid_ok = 0.0 < no_bid < 1.0
+    no_ask_ok = 0.0 < no_ask < 1.0
+    if no_bid_ok and no_ask_ok:
+        return ((1.0 - no_bid) + (1.0 - no_ask)) / 2.0
+    if no_bid_ok:
+        return 1.0 - no_bid
+    if no_ask_ok:
+        return 1.0 - no_ask
 
     return 0.0
 
 
-def _read_price(market: dict, base_field: str) -> float:
+# (cents field, dollars field) pairs in the order parse_market unpacks them.
+_PRICE_FIELDS = tuple(
+    (base, f"{base}_dollars")
+    for base in ("yes_bid", "yes_ask", "no_bid", "no_ask", "last_price")
+)
+
+
+def _read_prices(market: dict) -> list:
+    """Read yes_bid, yes_ask, no_bid, no_ask and last_price in one pass."""
+    return [_read_price(market, base, dollars) for base, dollars in _PRICE_FIELDS]
+
+
+def _read_price(market: dict, base_field: str, dollars_field: Optional[str] = None) -> float:
     """
     Read Kalshi price values from either:
     - legacy cent fields (e.g. yes_bid=51)
     - dollar fields (e.g. yes_bid_dollars=\"0.5100\")
     - normalized numeric dollars
     """
-    dollars_field = f"{base_field}_dollars"
-    if dollars_field in market and market[dollars_field] not in (None, ""):
+    if dollars_field is None:
+        dollars_field = f"{base_field}_dollars"
+    dollars = market.get(dollars_field)
+    value = None
+    if dollars is not None and dollars != "":
         try:
-            value = float(market[dollars_field])
-            return max(0.0, min(1.0, value))
+            value = float(dollars)
         except (TypeError, ValueError):
             pass
 
-    raw = market.get(base_field, 0)
-    try:
-        value = float(raw)
-    except (TypeError, ValueError):
-        return 0.0
-
-    # Legacy cents payload.
-    if value > 1.0:
-        return max(0.0, min(1.0, value / 100.0))
+    if value is None:
+        raw = market.get(base_field, 0)
+        try:
+            value = float(raw)
+        except (TypeError, ValueError):
+            return 0.0
+        # Legacy cents payload; otherwise already dollar-normalized.
+        if value > 1.0:
+            value /= 100.0
 
-    # Already dollar-normalized.
-    return max(0.0, min(1.0, value))
+    # Inline clamp to [0, 1]: cheaper than max(min(...)) and still maps NaN to 1.0.
+    return value if 0.0 <= value <= 1.0 else (0.0 if value < 0.0 else 1.0)
 
 
-def get_market_cost(parsed_market: dict) -> float:
+def get_market_cost(parsed_market: Market) -> float:
     """Choose the best available market cost for EV calculations."""
-    for key in ("yes_ask", "yes_price", "last_price"):
-        value = parsed_market.get(key, 0.0) or 0.0
-        if value > 0:
+    for value in (parsed_market.yes_ask, parsed_market.yes_price, parsed_market.last_price):
+        if value and value > 0:
             return float(value)
     return 0.0
 
@@ -330,13 +580,134 @@ def get_market_cost(parsed_market: dict) -> float:
 _cache: dict = {}
 CACHE_TTL = 300
 BT_CACHE_TTL = 1800
+# The background task rebuilds bets this often, ahead of CACHE_TTL expiring.
+REFRESH_INTERVAL = CACHE_TTL - 60
+_bets_lock = threading.Lock()
 _scrape_lock = threading.Lock()
 
+# Last BT scrape on local disk so a restart boots warm instead of waiting on a scrape.
+# Bump BT_SNAPSHOT_VERSION whenever the shape of the scraped data changes.
+# Defaults to a directory the app owns (created 0700), never a shared temp dir
+# where another local user could plant data.
+BT_SNAPSHOT_PATH = Path(
+    os.getenv("BT_SNAPSHOT_PATH", "").strip()
+    or Path(__file__).resolve().parent.parent / ".bt_cache" / "bt_cache.json"
+)
+BT_SNAPSHOT_VERSION = 1
+# Older snapshots are ignored; younger-but-stale ones are served while a rescrape runs.
+BT_SNAPSHOT_MAX_AGE = 24 * 3600
+# Expected type of each snapshot field; anything else means the file is ignored.
+_BT_SNAPSHOT_FIELDS = (
+    ("bt_tourney", dict),
+    ("bt_conferences", dict),
+    ("bt_schedule", list),
+    ("bt_time", (int, float)),
+)
 
-def _clear_data_cache() -> None:
-    keys = ("bets", "bets_time", "bt_tourney", "bt_conferences", "bt_schedule", "bt_time")
-    for key in keys:
-        _cache.pop(key, None)
+# Optional Redis layer shared by every worker. Without REDIS_URL (or if Redis is
+# unreachable) each process falls back to its own _cache as before.
+REDIS_URL = os.getenv("REDIS_URL", "").strip()
+BETS_LOCK_KEY = "bt:bets:lock"
+BETS_LOCK_TTL = 60
+BETS_LOCK_POLL = 0.5
+_RELEASE_LOCK_LUA = (
+    "if redis.call('get', KEYS[1]) == ARGV[1] then return redis.call('del', KEYS[1]) end return 0"
+)
+
+
+def _connect_redis():
+    if not REDIS_URL:
+        return None
+    try:
+        import redis
+    except ImportError:
+        logger.warning("REDIS_URL is set but redis is not installed; using in-process cache")
+        return None
+    return redis.Redis.from_url(REDIS_URL, socket_timeout=2, socket_connect_timeout=2)
+
+
+_redis = _connect_redis()
+
+
+def _shared_get(*keys: str) -> Optional[list]:
+    """Read and decode keys from Redis; None when Redis is off or unreachable."""
+    if _redis is None:
+        return None
+    try:
+        values = _redis.mget(keys)
+    except Exception as e:
+        logger.warning("Redis read failed, using in-process cache: %s", e)
+        return None
+    return [orjson.loads(v) if v is not None else None for v in values]
+
+
+def _shared_set(mapping: dict, ttl: int) -> None:
+    if _redis is None:
+        return
+    try:
+        pipe = _redis.pipeline()
+        for key, value in mapping.items():
+            pipe.set(key, orjson.dumps(value, option=ORJSON_OPTIONS), ex=ttl)
+        pipe.execute()
+    except Exception as e:
+        logger.warning("Redis write failed: %s", e)
+
+
+def _acquire_refresh_lock() -> Optional[str]:
+    """Return a release token, or None if another worker is already refreshing."""
+    token = uuid.uuid4().hex
+    if _redis is None:
+        return token
+    try:
+        if _redis.set(BETS_LOCK_KEY, token, nx=True, ex=BETS_LOCK_TTL):
+            return token
+        return None
+    except Exception as e:
+        logger.warning("Redis lock failed, refreshing locally: %s", e)
+        return token
+
+
+def _release_refresh_lock(token: str) -> None:
+    if _redis is None:
+        return
+    try:
+        _redis.eval(_RELEASE_LOCK_LUA, 1, BETS_LOCK_KEY, token)
+    except Exception as e:
+        logger.warning("Redis unlock failed: %s", e)
+
+
+# Pre-serialized endpoint bodies, rebuilt lazily after each bets refresh.
+PAYLOAD_KEYS = ("bets_payload", "summary_payload")
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z
+
+
+def _cached_payload(key: str, snapshot: BetsSnapshot, build) -> bytes:
+    # Tagged with the snapshot it was built from, so a body built while the
+    # background refresh was swapping in new bets is never served past that swap.
+    cached = _cache.get(key)
+    if cached is not None and cached[0] is snapshot:
+        return cached[1]
+    body = orjson.dumps(build(snapshot), option=ORJSON_OPTIONS)
+    _cache[key] = (snapshot, body)
+    return body
+
+
+_stamp_cache: list = [0, b""]
+
+
+def _timestamp_json() -> bytes:
+    """The current UTC time as an encoded ISO string, rebuilt at most once per second."""
+    second = int(time.time())
+    if _stamp_cache[0] != second:
+        iso = datetime.fromtimestamp(second, timezone.utc).isoformat(timespec="seconds")
+        _stamp_cache[:] = [second, orjson.dumps(iso)]
+    return _stamp_cache[1]
+
+
+def _timestamped_response(body: bytes) -> Response:
+    """Prepend a fresh timestamp to a cached JSON object body without re-encoding it."""
+    stamp = _timestamp_json()
+    return Response(content=b'{"timestamp":' + stamp + b"," + body[1:], media_type="application/json")
 
 
 def _scrape_barttorvik(force_refresh: bool = False):
@@ -348,9 +719,28 @@ def _scrape_barttorvik(force_refresh: bool = False):
     ):
         return
 
+    if not force_refresh:
+        shared = _shared_get("bt:tourney", "bt:conferences", "bt:schedule", "bt:time")
+        if shared and shared[0] is not None and now - (shared[3] or 0) < BT_CACHE_TTL:
+            (
+                _cache["bt_tourney"],
+                _cache["bt_conferences"],
+                _cache["bt_schedule"],
+                _cache["bt_time"],
+            ) = shared
+            return
+
     logger.info("Starting BartTorvik scrape...")
+    # The three pages are independent, so each gets its own browser and runs in parallel.
+    date_str = datetime.now().strftime("%Y%m%d")
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        tourney_future = executor.submit(scrape_tourneycast)
+        conf_future = executor.submit(scrape_all_conferences, date_str)
+        schedule_future = executor.submit(scrape_schedule)
+
+    tourney_data = None
     try:
-        tourney_data = scrape_tourneycast()
+        tourney_data = tourney_future.result()
         _cache["bt_tourney"] = tourney_data
         logger.info("Scraped %d teams from tourneycast", len(tourney_data))
     except Exception as e:
@@ -359,8 +749,7 @@ def _scrape_barttorvik(force_refresh: bool = False):
             _cache["bt_tourney"] = {}
 
     try:
-        date_str = datetime.now().strftime("%Y%m%d")
-        conf_data = scrape_all_conferences(date_str)
+        conf_data = conf_future.result()
         _cache["bt_conferences"] = conf_data
         logger.info("Scraped %d conferences from concast", len(conf_data))
     except Exception as e:
@@ -369,7 +758,7 @@ def _scrape_barttorvik(force_refresh: bool = False):
             _cache["bt_conferences"] = {}
 
     try:
-        schedule_data = scrape_schedule()
+        schedule_data = schedule_future.result()
         _cache["bt_schedule"] = schedule_data
         logger.info("Scraped %d games from schedule", len(schedule_data))
     except Exception as e:
@@ -378,92 +767,336 @@ def _scrape_barttorvik(force_refresh: bool = False):
             _cache["bt_schedule"] = []
 
     _cache["bt_time"] = time.time()
+    _shared_set(
+        {
+            "bt:tourney": _cache["bt_tourney"],
+            "bt:conferences": _cache["bt_conferences"],
+            "bt:schedule": _cache["bt_schedule"],
+            "bt:time": _cache["bt_time"],
+        },
+        BT_CACHE_TTL,
+    )
+    # A failed or empty scrape must not be persisted as fresh data for the whole TTL.
+    if tourney_data:
+        _save_bt_snapshot()
+    else:
+        logger.warning("TourneyCast returned no teams; not saving BT snapshot")
     logger.info("BartTorvik scrape complete")
 
 
-def get_cached_bets(force_refresh: bool = False) -> list:
-    now = time.time()
-    if (
-        not force_refresh
-        and "bets" in _cache
-        and now - _cache.get("bets_time", 0) < CACHE_TTL
-    ):
-        return _cache["bets"]
+def _save_bt_snapshot() -> None:
+    snapshot = {
+        "version": BT_SNAPSHOT_VERSION,
+        "bt_tourney": _cache["bt_tourney"],
+        "bt_conferences": _cache["bt_conferences"],
+        "bt_schedule": _cache["bt_schedule"],
+        "bt_time": _cache["bt_time"],
+    }
+    # Write-then-rename so a crash mid-write never leaves a truncated snapshot.
+    tmp_path = BT_SNAPSHOT_PATH.with_name(f"{BT_SNAPSHOT_PATH.name}.{os.getpid()}.tmp")
+    try:
+        BT_SNAPSHOT_PATH.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        tmp_path.write_bytes(orjson.dumps(snapshot, option=ORJSON_OPTIONS))
+        os.replace(tmp_path, BT_SNAPSHOT_PATH)
+    except OSError as e:
+        logger.warning("Could not write BT snapshot %s: %s", BT_SNAPSHOT_PATH, e)
+
+
+def _load_bt_snapshot() -> bool:
+    """Install the on-disk BT scrape if it is current enough; never raises."""
+    try:
+        snapshot = orjson.loads(BT_SNAPSHOT_PATH.read_bytes())
+    except FileNotFoundError:
+        return False
+    except (OSError, orjson.JSONDecodeError) as e:
+        logger.warning("Ignoring unreadable BT snapshot %s: %s", BT_SNAPSHOT_PATH, e)
+        return False
+    if not isinstance(snapshot, dict) or snapshot.get("version") != BT_SNAPSHOT_VERSION:
+        return False
+    for key, expected in _BT_SNAPSHOT_FIELDS:
+        value = snapshot.get(key)
+        if not isinstance(value, expected) or isinstance(value, bool):
+            logger.warning("Ignoring BT snapshot %s: bad or missing %r", BT_SNAPSHOT_PATH, key)
+            return False
+    if not snapshot["bt_tourney"] or time.time() - snapshot["bt_time"] >= BT_SNAPSHOT_MAX_AGE:
+        return False
+    for key, _ in _BT_SNAPSHOT_FIELDS:
+        _cache[key] = snapshot[key]
+    logger.info("Loaded BT snapshot from %s", BT_SNAPSHOT_PATH)
+    return True
+
+
+def get_cached_bets(force_refresh: bool = False, max_age: float = CACHE_TTL) -> BetsSnapshot:
+    snapshot = _cache.get("snapshot")
+    if not force_refresh and snapshot is not None and time.time() - snapshot.bets_time < max_age:
+        return snapshot
+
+    # One build per process at a time; whoever waited re-checks what the other built.
+    with _bets_lock:
+        snapshot = _cache.get("snapshot")
+        if not force_refresh and snapshot is not None and time.time() - snapshot.bets_time < max_age:
+            return snapshot
+        return _refresh_bets(force_refresh, max_age, time.time())
+
+
+def _refresh_bets(force_refresh: bool, max_age: float, now: float) -> BetsSnapshot:
+    if not force_refresh:
+        snapshot = _load_shared_bets(now, max_age=max_age)
+        if snapshot is not None:
+            return snapshot
+
+    token = _acquire_refresh_lock()
+    if token is None:
+        # Another worker is refreshing; wait for its result instead of scraping twice.
+        deadline = time.time() + BETS_LOCK_TTL
+        while time.time() < deadline:
+            time.sleep(BETS_LOCK_POLL)
+            snapshot = _load_shared_bets(time.time(), newer_than=now)
+            if snapshot is not None:
+                return snapshot
+        logger.warning("Timed out waiting for shared bets refresh; refreshing locally")
+
+    try:
+        make_tourney, conf_grouped = _build_bets(force_refresh)
+        _shared_set(
+            {"bt:bets": {"bets_time": now, "make_tourney": make_tourney, "conf_grouped": conf_grouped}},
+            CACHE_TTL,
+        )
+    finally:
+        if token is not None:
+            _release_refresh_lock(token)
+
+    return _install_bets(make_tourney, conf_grouped, now)
+
+
+def _load_shared_bets(
+    now: float, newer_than: float = 0.0, max_age: float = CACHE_TTL
+) -> Optional[BetsSnapshot]:
+    """Install bets (and the BT data they were built from) published by another worker."""
+    shared = _shared_get("bt:bets", "bt:tourney", "bt:conferences", "bt:schedule", "bt:time")
+    if not shared or shared[0] is None:
+        return None
+    blob = shared[0]
+    if now - blob["bets_time"] >= max_age or blob["bets_time"] < newer_than:
+        return None
+    if shared[1] is not None:
+        _cache["bt_tourney"], _cache["bt_conferences"], _cache["bt_schedule"], _cache["bt_time"] = shared[1:]
+    make_tourney = [Market(**b) for b in blob["make_tourney"]]
+    conf_grouped = {
+        conf: [Market(**b) for b in group] for conf, group in blob["conf_grouped"].items()
+    }
+    return _install_bets(make_tourney, conf_grouped, blob["bets_time"])
+
+
+def _ensure_barttorvik(force_refresh: bool) -> None:
+    """Scrape inline only when forced or cold; stale BT data is served while a thread rescrapes."""
+    if not force_refresh and "bt_tourney" not in _cache:
+        with _scrape_lock:
+            if "bt_tourney" not in _cache:
+                _load_bt_snapshot()
+    if force_refresh or "bt_tourney" not in _cache:
+        with _scrape_lock:
+            _scrape_barttorvik(force_refresh=force_refresh)
+        return
+    if time.time() - _cache.get("bt_time", 0) < BT_CACHE_TTL:
+        return
+    # A held lock means a scrape is already running; its result lands in the next build.
+    if _scrape_lock.acquire(blocking=False):
+        threading.Thread(target=_background_scrape, name="bt-scrape", daemon=True).start()
+
+
+def _background_scrape() -> None:
+    # Runs with _scrape_lock already held by _ensure_barttorvik.
+    try:
+        _scrape_barttorvik()
+    except Exception:
+        logger.exception("Background BartTorvik scrape failed")
+    finally:
+        _scrape_lock.release()
+
 
-    with _scrape_lock:
-        _scrape_barttorvik(force_refresh=force_refresh)
+def _build_bets(force_refresh: bool) -> Tuple[list, dict]:
+    _ensure_barttorvik(force_refresh)
 
     bt_tourney = _cache.get("bt_tourney", {})
     bt_conferences = _cache.get("bt_conferences", {})
+    # Normalize every BT name once per build instead of once per Kalshi market.
+    bt_tourney_norm = _cache["bt_tourney_norm"] = build_name_index(bt_tourney)
+    bt_conf_norm = _cache["bt_conf_norm"] = {
+        conf: build_conf_index(teams) for conf, teams in bt_conferences.items()
+    }
 
-    all_bets: list = []
-
-    raw = fetch_markets_by_series(MAKE_TOURNAMENT_SERIES)
-    for m in raw:
-        parsed = parse_market(m, "Make Tournament", "March Madness")
-        if not parsed:
-            continue
+    make_tourney: list = []
+    conf_grouped: dict = {}
 
-        bt_match = match_team_name(parsed["team_name"], bt_tourney)
+    # Every series paginates independently, so fetch and parse them all at once.
+    with ThreadPoolExecutor(max_workers=SERIES_FETCH_WORKERS) as executor:
+        make_future = executor.submit(
+            parse_series, MAKE_TOURNAMENT_SERIES, "Make Tournament", "March Madness"
+        )
+        conf_futures = {
+            conf: executor.submit(parse_series, series, "Conference Champion", conf)
+            for conf, series in CONFERENCE_SERIES_MAP.items()
+        }
+        make_parsed = make_future.result()
+        conf_parsed = {conf: future.result() for conf, future in conf_futures.items()}
+
+    for parsed in make_parsed:
+        bt_match = match_team_name(parsed.team_name, bt_tourney, bt_tourney_norm)
         if bt_match and bt_match in bt_tourney:
             bt_data = bt_tourney[bt_match]
             bt_prob = bt_data["in_probability"]
-            parsed["bt_probability"] = round(bt_prob, 4)
-            parsed["bt_source"] = f"BT: {bt_data['team']} ({bt_data['conference']})"
+            parsed.bt_probability = round(bt_prob, 4)
+            parsed.bt_source = f"BT: {bt_data['team']} ({bt_data['conference']})"
 
             cost = get_market_cost(parsed)
             if cost > 0:
-                parsed["ev"] = round(bt_prob * 1.0 - cost, 4)
+                parsed.ev = round(bt_prob * 1.0 - cost, 4)
 
-        all_bets.append(parsed)
+        make_tourney.append(parsed)
 
-    for conf, series in CONFERENCE_SERIES_MAP.items():
-        time.sleep(0.3)
-        raw = fetch_markets_by_series(series)
+    for conf, parsed_markets in conf_parsed.items():
         bt_conf_teams = bt_conferences.get(conf, [])
+        bt_conf_index = bt_conf_norm.get(conf) or build_conf_index(bt_conf_teams)
 
-        for m in raw:
-            parsed = parse_market(m, "Conference Champion", conf)
-            if not parsed:
-                continue
-
-            bt_match = match_conf_team(parsed["team_name"], bt_conf_teams)
+        for parsed in parsed_markets:
+            bt_match = match_conf_team(parsed.team_name, bt_conf_teams, bt_conf_index)
             if bt_match:
                 sole_prob = bt_match["sole_probability"]
                 share_prob = bt_match["share_probability"]
                 share_only_prob = share_prob - sole_prob
 
                 effective_prob = sole_prob * 1.0 + share_only_prob * 0.5
-                parsed["bt_probability"] = round(share_prob, 4)
-                parsed["bt_source"] = (
+                parsed.bt_probability = round(share_prob, 4)
+                parsed.bt_source = (
                     f"BT: {bt_match['team']} "
                     f"(Share: {share_prob*100:.1f}%, Sole: {sole_prob*100:.1f}%)"
                 )
-                parsed["share_prob"] = round(share_prob, 4)
-                parsed["sole_prob"] = round(sole_prob, 4)
+                parsed.share_prob = round(share_prob, 4)
+                parsed.sole_prob = round(sole_prob, 4)
 
                 cost = get_market_cost(parsed)
                 if cost > 0:
-                    parsed["ev"] = round(effective_prob - cost, 4)
+                    parsed.ev = round(effective_prob - cost, 4)
+
+            conf_grouped.setdefault(conf, []).append(parsed)
+
+    make_tourney.sort(key=_ev_key, reverse=True)
+    for group in conf_grouped.values():
+        group.sort(key=_ev_key, reverse=True)
+    # Order groups by their best edge, matching the old first-appearance order over sorted bets.
+    conf_grouped = dict(sorted(conf_grouped.items(), key=lambda kv: kv[1][0].ev, reverse=True))
+    return make_tourney, conf_grouped
+
+
+def _ev_key(bet: Market) -> float:
+    return bet.ev
+
+
+def _install_bets(make_tourney: list, conf_grouped: dict, bets_time: float) -> BetsSnapshot:
+    # Only the partitions are shown in EV order; the flat lists just feed counts and
+    # heapq top-K picks, which break ties by position exactly as a merged order would.
+    conference = [b for group in conf_grouped.values() for b in group]
+    all_bets = make_tourney + conference
+
+    snapshot = BetsSnapshot(
+        bets=all_bets,
+        make_tourney=make_tourney,
+        conference=conference,
+        conf_grouped=conf_grouped,
+        derived=_derive_views(all_bets, conf_grouped),
+        bets_time=bets_time,
+        bt_tourney=_cache.get("bt_tourney", {}),
+        bt_conferences=_cache.get("bt_conferences", {}),
+        bt_schedule=_cache.get("bt_schedule", []),
+        bt_time=_cache.get("bt_time", 0),
+    )
+    # A single store: readers see the old snapshot or the new one, never a mix.
+    _cache["snapshot"] = snapshot
+    for key in PAYLOAD_KEYS:
+        _cache.pop(key, None)
+    return snapshot
+
+
+def _derive_views(bets: list, conf_grouped: dict) -> dict:
+    """Everything the endpoints select from the bets, computed once per cache fill."""
+    # One pass sorts every bet into the buckets the views select from.
+    positive: list = []
+    matched: list = []
+    matched_negative: list = []
+    for b in bets:
+        ev = b.ev
+        if ev > 0:
+            positive.append(b)
+        if b.bt_probability > 0:
+            matched.append(b)
+            if ev < 0:
+                matched_negative.append(b)
+
+    positive_ev_20 = heapq.nlargest(20, positive, key=_ev_key)
+    # Fallback for thin markets: still show top matched edges so dashboard is never blank.
+    best_ev_20 = positive_ev_20 or heapq.nlargest(20, matched, key=_ev_key)
+    return {
+        "positive_ev_20": positive_ev_20,
+        "best_ev_20": best_ev_20,
+        "positive_ev_10": positive_ev_20[:10],
+        "best_ev_10": best_ev_20[:10],
+        "worst_ev_10": heapq.nsmallest(10, matched_negative, key=_ev_key),
+        "positive_ev_count": len(positive),
+        "conf_counts": {conf: len(group) for conf, group in conf_grouped.items()},
+        "matched_count": len(matched),
+    }
 
-            all_bets.append(parsed)
 
-    all_bets.sort(key=lambda x: x["ev"], reverse=True)
+def _cache_stats() -> dict:
+    """Entry counts and shallow sizes per _cache key; never the values themselves."""
+    return {
+        key: {
+            "entries": len(value) if hasattr(value, "__len__") else None,
+            "bytes": sys.getsizeof(value),
+        }
+        for key, value in list(_cache.items())
+    }
+
+
+async def _refresh_loop() -> None:
+    # With Redis, the refresh lock makes one worker the builder and the rest load its result.
+    while True:
+        try:
+            await run_in_threadpool(get_cached_bets, max_age=REFRESH_INTERVAL)
+            logger.info("Cache stats: %s", _cache_stats())
+        except Exception as e:
+            logger.error("Background bets refresh failed: %s", e)
+        await asyncio.sleep(REFRESH_INTERVAL)
+
 
-    _cache["bets"] = all_bets
-    _cache["bets_time"] = now
-    return all_bets
+@app.on_event("startup")
+async def start_background_refresh():
+    # Not awaited: a cold scrape takes tens of seconds and /healthz must answer meanwhile.
+    app.state.refresh_task = asyncio.create_task(_refresh_loop())
 
 
-@app.get("/healthz")
+@app.on_event("startup")
+async def warm_users_db():
+    # Pay the argon2 hash off the event loop before the first login arrives.
+    await run_in_threadpool(_users_db)
+
+
+@app.on_event("shutdown")
+async def stop_background_refresh():
+    app.state.refresh_task.cancel()
+
+
+@app.get("/healthz", response_model=None)
 async def healthz():
     return {"status": "ok"}
 
 
 @app.post("/token", response_model=Token)
-async def login(form_data: OAuth2PasswordRequestForm = Depends()):
-    password_hash = USERS_DB.get(form_data.username)
-    if not password_hash or not pbkdf2_sha256.verify(form_data.password, password_hash):
+def login(form_data: OAuth2PasswordRequestForm = Depends()):
+    # Sync on purpose: the argon2 verify and the Redis lookup block, so FastAPI runs
+    # this in its threadpool instead of on the event loop.
+    if not verify_password(form_data.username, form_data.password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect username or password",
@@ -476,107 +1109,73 @@ async def login(form_data: OAuth2PasswordRequestForm = Depends()):
     return {"access_token": access_token, "token_type": "bearer"}
 
 
-@app.get("/api/bets")
-async def get_bets(
-    user: str = Depends(get_current_user),
-    refresh: bool = Query(default=False),
-):
-    bets = get_cached_bets(force_refresh=refresh)
-    make_tourney = [b for b in bets if b["market_type"] == "Make Tournament"]
-    conference = [b for b in bets if b["market_type"] == "Conference Champion"]
-
-    conf_grouped: dict = {}
-    for b in conference:
-        conf_grouped.setdefault(b["conference"], []).append(b)
-
-    positive_ev = sorted(
-        [b for b in bets if b["ev"] > 0],
-        key=lambda x: x["ev"],
-        reverse=True,
-    )[:20]
-    best_ev = positive_ev
-    if not best_ev:
-        # Fallback for thin markets: still show top matched edges so dashboard is never blank.
-        best_ev = sorted(
-            [b for b in bets if b["bt_probability"] > 0],
-            key=lambda x: x["ev"],
-            reverse=True,
-        )[:20]
-
+def _build_bets_payload(snapshot: BetsSnapshot) -> dict:
+    derived = snapshot.derived
     bt_status = {
-        "tourney_teams": len(_cache.get("bt_tourney", {})),
-        "conferences_scraped": list(_cache.get("bt_conferences", {}).keys()),
-        "schedule_games": len(_cache.get("bt_schedule", [])),
-        "last_scrape": _cache.get("bt_time", 0),
+        "tourney_teams": len(snapshot.bt_tourney),
+        "conferences_scraped": list(snapshot.bt_conferences.keys()),
+        "schedule_games": len(snapshot.bt_schedule),
+        "last_scrape": snapshot.bt_time,
     }
 
     return {
-        "timestamp": datetime.now(timezone.utc).isoformat(),
-        "total_markets": len(bets),
-        "make_tournament": make_tourney,
-        "conference_markets": conf_grouped,
-        "best_ev_bets": best_ev,
-        "positive_ev_bets": positive_ev,
+        "total_markets": len(snapshot.bets),
+        "make_tournament": snapshot.make_tourney,
+        "conference_markets": snapshot.conf_grouped,
+        "best_ev_bets": derived["best_ev_20"],
+        "positive_ev_bets": derived["positive_ev_20"],
         "bt_status": bt_status,
-        "schedule": _cache.get("bt_schedule", []),
+        "schedule": snapshot.bt_schedule,
     }
 
 
-@app.post("/api/refresh")
+@app.get("/api/bets", response_model=None)
+async def get_bets(
+    user: str = Depends(get_current_user),
+    refresh: bool = Query(default=False),
+):
+    snapshot = await run_in_threadpool(get_cached_bets, force_refresh=refresh)
+    return _timestamped_response(_cached_payload("bets_payload", snapshot, _build_bets_payload))
+
+
+@app.post("/api/refresh", response_model=None)
 async def refresh_data(user: str = Depends(get_current_user)):
-    _clear_data_cache()
-    # Rebuild cache immediately so subsequent reads are hot and consistent.
-    bets = get_cached_bets(force_refresh=True)
+    # Rebuild immediately; readers keep the previous snapshot until the new one is
+    # installed, so nothing is cleared out from under a concurrent request.
+    snapshot = await run_in_threadpool(get_cached_bets, force_refresh=True)
     return {
         "ok": True,
-        "refreshed_at": datetime.now(timezone.utc).isoformat(),
-        "total_markets": len(bets),
+        "refreshed_at": datetime.now(timezone.utc),
+        "total_markets": len(snapshot.bets),
     }
 
 
-@app.get("/api/summary")
+def _build_summary_payload(snapshot: BetsSnapshot) -> dict:
+    derived = snapshot.derived
+    conf_counts = derived["conf_counts"]
+    return {
+        "total_make_tournament": len(snapshot.make_tourney),
+        "total_conference": len(snapshot.conference),
+        "conferences_tracked": list(conf_counts.keys()),
+        "conference_counts": conf_counts,
+        "best_ev_bets": derived["best_ev_10"],
+        "positive_ev_bets": derived["positive_ev_10"],
+        "positive_ev_count": derived["positive_ev_count"],
+        "worst_ev_bets": derived["worst_ev_10"],
+        "matched_teams": derived["matched_count"],
+        "total_markets": len(snapshot.bets),
+    }
+
+
+@app.get("/api/summary", response_model=None)
 async def get_summary(
     user: str = Depends(get_current_user),
     refresh: bool = Query(default=False),
 ):
-    bets = get_cached_bets(force_refresh=refresh)
-    make_tourney = [b for b in bets if b["market_type"] == "Make Tournament"]
-    conference = [b for b in bets if b["market_type"] == "Conference Champion"]
-
-    positive_ev = sorted(
-        [b for b in bets if b["ev"] > 0],
-        key=lambda x: x["ev"],
-        reverse=True,
-    )[:10]
-    best_ev = positive_ev
-    if not best_ev:
-        best_ev = sorted(
-            [b for b in bets if b["bt_probability"] > 0],
-            key=lambda x: x["ev"],
-            reverse=True,
-        )[:10]
-
-    worst_ev = sorted(
-        [b for b in bets if b["ev"] < 0 and b["bt_probability"] > 0],
-        key=lambda x: x["ev"],
-    )[:10]
-
-    conf_counts: dict = {}
-    for b in conference:
-        conf_counts[b["conference"]] = conf_counts.get(b["conference"], 0) + 1
-
-    matched_count = sum(1 for b in bets if b["bt_probability"] > 0)
+    snapshot = await run_in_threadpool(get_cached_bets, force_refresh=refresh)
+    return _timestamped_response(_cached_payload("summary_payload", snapshot, _build_summary_payload))
 
-    return {
-        "timestamp": datetime.now(timezone.utc).isoformat(),
-        "total_make_tournament": len(make_tourney),
-        "total_conference": len(conference),
-        "conferences_tracked": list(conf_counts.keys()),
-        "conference_counts": conf_counts,
-        "best_ev_bets": best_ev,
-        "positive_ev_bets": positive_ev,
-        "positive_ev_count": sum(1 for b in bets if b["ev"] > 0),
-        "worst_ev_bets": worst_ev,
-        "matched_teams": matched_count,
-        "total_markets": len(bets),
-    }
+
+@app.get("/api/_cache_stats", response_model=None)
+async def cache_stats(user: str = Depends(get_current_user)):
+    return _cache_stats()
@@ -1,10 +1,12 @@
 import logging
-import time
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Dict, List
 from pathlib import Path
 
+import lxml.html
+import requests
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
@@ -17,6 +19,7 @@ logger = logging.getLogger(__name__)
 TOURNEYCAST_URL = "https://barttorvik.com/tourneycast.php"
 CONCAST_URL = "https://barttorvik.com/concast.php?conlimit={conf}&date={date}"
 SCHEDULE_URL = "https://barttorvik.com/schedule.php"
+CONCAST_WORKERS = 4
 
 BARTTORVIK_CONF_CODES = {
     "SEC": "SEC",
@@ -86,6 +89,51 @@ def _create_driver():
     return driver
 
 
+_http = requests.Session()
+_http.headers["User-Agent"] = (
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/120.0 Safari/537.36"
+)
+
+
+def _render_html(url: str, wait_timeout: int) -> str:
+    """Load a page in headless Chrome and return its HTML once a table is present."""
+    driver = _create_driver()
+    try:
+        driver.get(url)
+        WebDriverWait(driver, wait_timeout).until(
+            EC.presence_of_element_located((By.TAG_NAME, "table"))
+        )
+        return driver.page_source
+    finally:
+        driver.quit()
+
+
+def _fetch_html(url: str, wait_timeout: int) -> str:
+    """
+    Fetch a page over plain HTTP. BartTorvik serves its tables as static HTML,
+    but it can answer with a JS browser check instead; only then pay for Chrome.
+    """
+    try:
+        resp = _http.get(url, timeout=20)
+        resp.raise_for_status()
+        if "<table" in resp.text.lower():
+            return resp.text
+        logger.info("No table in static HTML for %s; rendering with Chrome", url)
+    except requests.RequestException as e:
+        logger.warning("HTTP fetch failed for %s (%s); rendering with Chrome", url, e)
+    return _render_html(url, wait_timeout)
+
+
+def _first_table(html: str):
+    tables = lxml.html.fromstring(html).xpath("//table")
+    return tables[0] if tables else None
+
+
+def _texts(cells) -> List[str]:
+    return [c.text_content().strip() for c in cells]
+
+
 def _parse_pct(text: str) -> float:
     text = text.replace("%", "").replace(",", "").strip()
     if not text or text == "-" or text == "N/A":
@@ -98,23 +146,19 @@ def _parse_pct(text: str) -> float:
 
 def scrape_tourneycast() -> Dict[str, Dict]:
     logger.info("Scraping tourneycast.php")
-    driver = _create_driver()
     teams: Dict[str, Dict] = {}
     try:
-        driver.get(TOURNEYCAST_URL)
-        time.sleep(8)
-
-        WebDriverWait(driver, 20).until(
-            EC.presence_of_element_located((By.TAG_NAME, "table"))
-        )
-
-        table = driver.find_element(By.TAG_NAME, "table")
+        table = _first_table(_fetch_html(TOURNEYCAST_URL, wait_timeout=20))
+        if table is None:
+            logger.error("No table found on tourneycast")
+            return teams
 
-        first_header_row = table.find_element(By.CSS_SELECTOR, "tr")
-        header_cells = first_header_row.find_elements(By.TAG_NAME, "th")
-        if not header_cells:
-            header_cells = first_header_row.find_elements(By.TAG_NAME, "td")
-        header_names = [h.text.strip().upper() for h in header_cells]
+        rows = table.xpath(".//tr")
+        first_header_row = rows[0] if rows else None
+        header_cells = first_header_row.xpath("./th") if first_header_row is not None else []
+        if not header_cells and first_header_row is not None:
+            header_cells = first_header_row.xpath("./td")
+        header_names = [h.upper() for h in _texts(header_cells)]
         logger.info("Tourneycast first header row: %s", header_names)
         num_cols = len(header_names)
 
@@ -133,17 +177,16 @@ def scrape_tourneycast() -> Dict[str, Dict]:
             logger.error("Could not find required columns. Headers: %s", header_names)
             return teams
 
-        rows = table.find_elements(By.TAG_NAME, "tr")
         logger.info("Found %d rows in tourneycast", len(rows))
 
         for row in rows:
-            cells = row.find_elements(By.TAG_NAME, "td")
+            cells = _texts(row.xpath("./td"))
             if len(cells) < num_cols:
                 continue
 
-            team_name = cells[team_col].text.strip()
-            in_pct = _parse_pct(cells[in_col].text)
-            conference = cells[conf_col].text.strip() if conf_col is not None and len(cells) > conf_col else ""
+            team_name = cells[team_col]
+            in_pct = _parse_pct(cells[in_col])
+            conference = cells[conf_col] if conf_col is not None and len(cells) > conf_col else ""
 
             if not team_name:
                 continue
@@ -158,8 +201,6 @@ def scrape_tourneycast() -> Dict[str, Dict]:
 
     except Exception as e:
         logger.error("Error scraping tourneycast: %s", e)
-    finally:
-        driver.quit()
 
     return teams
 
@@ -167,24 +208,14 @@ def scrape_tourneycast() -> Dict[str, Dict]:
 def scrape_concast(conf_code: str, date_str: str) -> List[Dict]:
     url = CONCAST_URL.format(conf=conf_code, date=date_str)
     logger.info("Scraping concast: %s", url)
-    driver = _create_driver()
     teams: List[Dict] = []
     try:
-        driver.get(url)
-        time.sleep(5)
-
-        WebDriverWait(driver, 15).until(
-            EC.presence_of_element_located((By.TAG_NAME, "table"))
-        )
-
-        tables = driver.find_elements(By.TAG_NAME, "table")
-        if not tables:
+        table = _first_table(_fetch_html(url, wait_timeout=15))
+        if table is None:
             logger.error("No tables found for %s", conf_code)
             return teams
 
-        table = tables[0]
-        headers = table.find_elements(By.TAG_NAME, "th")
-        header_names = [h.text.strip().upper() for h in headers]
+        header_names = [h.upper() for h in _texts(table.xpath(".//th"))]
         logger.info("Concast %s headers: %s", conf_code, header_names)
 
         team_col = None
@@ -202,15 +233,15 @@ def scrape_concast(conf_code: str, date_str: str) -> List[Dict]:
             logger.error("Could not find required columns for %s. Headers: %s", conf_code, header_names)
             return teams
 
-        rows = table.find_elements(By.TAG_NAME, "tr")
+        rows = table.xpath(".//tr")
         for row in rows[1:]:
-            cells = row.find_elements(By.TAG_NAME, "td")
+            cells = _texts(row.xpath("./td"))
             if len(cells) <= max(team_col, share_col):
                 continue
 
-            team_name = cells[team_col].text.strip()
-            share_pct = _parse_pct(cells[share_col].text)
-            sole_pct = _parse_pct(cells[sole_col].text) if sole_col is not None and len(cells) > sole_col else 0.0
+            team_name = cells[team_col]
+            share_pct = _parse_pct(cells[share_col])
+            sole_pct = _parse_pct(cells[sole_col]) if sole_col is not None and len(cells) > sole_col else 0.0
 
             if not team_name:
                 continue
@@ -226,48 +257,54 @@ def scrape_concast(conf_code: str, date_str: str) -> List[Dict]:
 
     except Exception as e:
         logger.error("Error scraping concast for %s: %s", conf_code, e)
-    finally:
-        driver.quit()
 
     return teams
 
 
+def _scrape_conference(kalshi_name: str, bt_code: str, date_str: str) -> List[Dict]:
+    try:
+        return scrape_concast(bt_code, date_str)
+    except Exception as e:
+        # One bad conference must not lose the rest of the batch.
+        logger.error("Error scraping conference %s: %s", kalshi_name, e)
+        return []
+
+
 def scrape_all_conferences(date_str: str) -> Dict[str, List[Dict]]:
     all_conf_data: Dict[str, List[Dict]] = {}
-    for kalshi_name, bt_code in BARTTORVIK_CONF_CODES.items():
-        teams = scrape_concast(bt_code, date_str)
-        if teams:
-            all_conf_data[kalshi_name] = teams
-        time.sleep(1)
+    # Small pool: a Chrome fallback per worker is the worst case for memory and fds.
+    with ThreadPoolExecutor(max_workers=CONCAST_WORKERS) as executor:
+        results = executor.map(
+            lambda kv: _scrape_conference(kv[0], kv[1], date_str),
+            BARTTORVIK_CONF_CODES.items(),
+        )
+        for kalshi_name, teams in zip(BARTTORVIK_CONF_CODES, results):
+            if teams:
+                all_conf_data[kalshi_name] = teams
     return all_conf_data
 
 
 def scrape_schedule() -> List[Dict]:
     logger.info("Scraping schedule.php")
-    driver = _create_driver()
     games: List[Dict] = []
     try:
-        driver.get(SCHEDULE_URL)
-        time.sleep(5)
+        table = _first_table(_fetch_html(SCHEDULE_URL, wait_timeout=15))
+        if table is None:
+            logger.error("No table found on schedule")
+            return games
 
-        WebDriverWait(driver, 15).until(
-            EC.presence_of_element_located((By.TAG_NAME, "table"))
-        )
-
-        table = driver.find_element(By.TAG_NAME, "table")
-        headers = table.find_elements(By.TAG_NAME, "th")
-        header_names = [h.text.strip().upper() for h in headers]
+        header_names = [h.upper() for h in _texts(table.xpath(".//th"))]
         logger.info("Schedule headers: %s", header_names)
 
-        rows = table.find_elements(By.TAG_NAME, "tr")
+        rows = table.xpath(".//tr")
         for row in rows[1:]:
-            cells = row.find_elements(By.TAG_NAME, "td")
+            cells = _texts(row.xpath("./td"))
             if len(cells) < 2:
                 continue
 
-            time_text = cells[0].text.strip() if len(cells) > 0 else ""
-            matchup_text = cells[1].text.strip() if len(cells) > 1 else ""
-            line_text = cells[2].text.strip() if len(cells) > 2 else ""
+            time_text = cells[0]
+            matchup_text = cells[1]
+            line_text = cells[2] if len(cells) > 2 else ""
 
             if not matchup_text:
                 continue
@@ -282,7 +319,5 @@ def scrape_schedule() -> List[Dict]:
 
     except Exception as e:
         logger.error("Error scraping schedule: %s", e)
-    finally:
-        driver.quit()
 
     return games
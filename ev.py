@@ -1,8 +1,14 @@
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
+import heapq
 import logging
 from dataclasses import dataclass
+from operator import attrgetter
 
-@dataclass
+import numpy as np
+
+from kalshi.models import Contract
+
+@dataclass(slots=True, frozen=True)
 class Bet:
     market_type: str
     league_conf: str
@@ -20,11 +26,11 @@ class EVCalculator:
         self.share_factor = share_factor
         self.logger = logging.getLogger(__name__)
     
-    def calculate_make_tournament_ev(self, team_data: Dict, contract: Dict) -> Optional[Bet]:
+    def calculate_make_tournament_ev(self, team_data: Dict, contract: Contract) -> Optional[Bet]:
         """Calculate EV for Make Tournament markets"""
         try:
             model_prob = team_data['in_probability']
-            market_price = contract['yes_price']
+            market_price = contract.yes_price
             
             # EV = model_prob - market_price
             ev = model_prob - market_price
@@ -41,7 +47,7 @@ class EVCalculator:
                     yes_price=market_price,
                     ev=ev,
                     edge=edge,
-                    contract_ticker=contract.get('ticker', ''),
+                    contract_ticker=contract.ticker,
                     team_name=team_data['team']
                 )
             
@@ -51,13 +57,13 @@ class EVCalculator:
             self.logger.error(f"Error calculating make tournament EV: {e}")
             return None
     
-    def calculate_conference_champ_ev(self, team_data: Dict, contract: Dict, 
+    def calculate_conference_champ_ev(self, team_data: Dict, contract: Contract, 
                                     conference: str) -> Optional[Bet]:
         """Calculate EV for Conference Champion markets"""
         try:
             p_sole = team_data['sole_probability']
             p_share = team_data['share_probability']
-            market_price = contract['yes_price']
+            market_price = contract.yes_price
             
             # Expected payout = p_sole * 1.0 + p_share * share_factor
             exp_payout = p_sole * 1.0 + p_share * self.share_factor
@@ -77,7 +83,7 @@ class EVCalculator:
                     yes_price=market_price,
                     ev=ev,
                     edge=edge,
-                    contract_ticker=contract.get('ticker', ''),
+                    contract_ticker=contract.ticker,
                     team_name=team_data['team']
                 )
             
@@ -87,18 +93,18 @@ class EVCalculator:
             self.logger.error(f"Error calculating conference champ EV: {e}")
             return None
     
-    def calculate_game_winner_ev(self, game_data: Dict, contract: Dict, 
+    def calculate_game_winner_ev(self, game_data: Dict, contract: Contract, 
                                favored_team: str) -> Optional[Bet]:
         """Calculate EV for Game Winner markets"""
         try:
             # Determine which team we're betting on
-            if contract['team_name'].lower() == favored_team.lower():
+            if contract.team_name.lower() == favored_team.lower():
                 model_prob = game_data['win_probability']
             else:
                 # Underdog probability
                 model_prob = 1.0 - game_data['win_probability']
             
-            market_price = contract['yes_price']
+            market_price = contract.yes_price
             
             # EV = model_prob - market_price
             ev = model_prob - market_price
@@ -110,13 +116,13 @@ class EVCalculator:
                 return Bet(
                     market_type="Game Winner",
                     league_conf="NCAA",
-                    description=f"{contract['team_name']} vs {game_data['away_team'] if game_data['away_team'] != contract['team_name'] else game_data['home_team']}",
+                    description=f"{contract.team_name} vs {game_data['away_team'] if game_data['away_team'] != contract.team_name else game_data['home_team']}",
                     model_prob_or_exp_payout=model_prob,
                     yes_price=market_price,
                     ev=ev,
                     edge=edge,
-                    contract_ticker=contract.get('ticker', ''),
-                    team_name=contract['team_name']
+                    contract_ticker=contract.ticker,
+                    team_name=contract.team_name
                 )
             
             return None
@@ -125,27 +131,92 @@ class EVCalculator:
             self.logger.error(f"Error calculating game winner EV: {e}")
             return None
     
+    def _calc_vectorized(self, matched_data: List[Dict], market_type: str,
+                         conference: Optional[str], top_k: Optional[int] = None) -> List[Bet]:
+        """EV for make_tournament/conference_champ rows as array ops; Bets are built only for survivors"""
+        prob_keys: Tuple[str, ...]
+        if market_type == "make_tournament":
+            prob_keys = ('in_probability',)
+        else:
+            prob_keys = ('sole_probability', 'share_probability')
+
+        # One row per match: model probabilities then yes_price. NaN marks a bad row.
+        cols = np.full((len(matched_data), len(prob_keys) + 1), np.nan)
+        for i, match in enumerate(matched_data):
+            try:
+                team_data = match['model_data']
+                cols[i, :-1] = [team_data[k] for k in prob_keys]
+                cols[i, -1] = match['contract'].yes_price
+            except (KeyError, AttributeError, TypeError, ValueError):
+                continue
+
+        if market_type == "make_tournament":
+            payout = cols[:, 0]
+        else:
+            # Expected payout = p_sole * 1.0 + p_share * share_factor
+            payout = cols[:, 0] + cols[:, 1] * self.share_factor
+        ev = payout - cols[:, -1]
+
+        valid = np.isfinite(ev)
+        dropped = len(ev) - int(valid.sum())
+        if dropped:
+            self.logger.warning(f"Skipped {dropped} {market_type} rows with missing or invalid data")
+
+        # Stable argsort on -ev keeps input order among equal EVs, like list.sort(reverse=True).
+        idx = np.flatnonzero(valid & (ev >= self.min_ev))
+        idx = idx[np.argsort(-ev[idx], kind="stable")]
+        if top_k is not None:
+            idx = idx[:top_k]
+
+        bets = []
+        for i in idx:
+            try:
+                team = matched_data[i]['model_data']['team']
+                contract = matched_data[i]['contract']
+                if market_type == "make_tournament":
+                    market_label, league_conf = "Make Tournament", "March Madness"
+                    description = f"{team} to Make Tournament"
+                else:
+                    # Bet.league_conf is a str; callers always name the conference here
+                    market_label, league_conf = "Conference Champion", conference or ""
+                    description = f"{team} to Win {conference}"
+                bets.append(Bet(
+                    market_type=market_label,
+                    league_conf=league_conf,
+                    description=description,
+                    model_prob_or_exp_payout=float(payout[i]),
+                    yes_price=contract.yes_price,
+                    ev=float(ev[i]),
+                    # Edge is same as EV for these markets
+                    edge=float(ev[i]),
+                    contract_ticker=contract.ticker,
+                    team_name=team
+                ))
+            except Exception as e:
+                self.logger.error(f"Error calculating {market_type} EV: {e}")
+        return bets
+
     def calculate_all_bets(self, matched_data: List[Dict], market_type: str, 
-                         conference: str = None) -> List[Bet]:
-        """Calculate EV for all matched bets"""
+                         conference: Optional[str] = None, top_k: Optional[int] = None) -> List[Bet]:
+        """Calculate EV for all matched bets, best first; only the best `top_k` if given"""
+        if market_type in ("make_tournament", "conference_champ"):
+            bets = self._calc_vectorized(matched_data, market_type, conference, top_k)
+            self.logger.info(f"Calculated {len(bets)} qualifying bets for {market_type}")
+            return bets
+
         bets = []
         
         for match in matched_data:
-            team_data = match['model_data']
             contract = match['contract']
             
-            if market_type == "make_tournament":
-                bet = self.calculate_make_tournament_ev(team_data, contract)
-            elif market_type == "conference_champ":
-                bet = self.calculate_conference_champ_ev(team_data, contract, conference)
-            elif market_type == "game_winner":
+            if market_type == "game_winner":
                 # For games, we need the game data and favored team
                 game_data = match.get('game_data')
                 favored_team = match.get('favored_team')
                 if game_data and favored_team:
                     bet = self.calculate_game_winner_ev(game_data, contract, favored_team)
                 else:
-                    self.logger.warning(f"Missing game data for {contract['team_name']}")
+                    self.logger.warning(f"Missing game data for {contract.team_name}")
                     bet = None
             else:
                 self.logger.warning(f"Unknown market type: {market_type}")
@@ -155,7 +226,10 @@ class EVCalculator:
                 bets.append(bet)
         
         # Sort by EV descending
-        bets.sort(key=lambda x: x.ev, reverse=True)
+        if top_k is not None:
+            bets = heapq.nlargest(top_k, bets, key=attrgetter("ev"))
+        else:
+            bets.sort(key=attrgetter("ev"), reverse=True)
         
         self.logger.info(f"Calculated {len(bets)} qualifying bets for {market_type}")
         return bets
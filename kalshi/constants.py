@@ -0,0 +1,15 @@
+"""Kalshi series tickers for the markets this project trades."""
+
+MAKE_TOURNAMENT_SERIES = "KXMAKEMARMAD"
+
+CONFERENCE_SERIES_MAP = {
+    "SEC": "KXSECREG",
+    "Big 12": "KXBIG12REG",
+    "ACC": "KXACCREG",
+    "Big Ten": "KXBIG10REG",
+    "Big East": "KXBIGEASTREG",
+    "West Coast Conference": "KXWCCREG",
+    "Mountain West Conference": "KXMWREG",
+    "Atlantic 10 Conference": "KXA10REG",
+    "American Athletic Conference": "KXAACREG",
+}
@@ -1,41 +1,159 @@
+import functools
 import os
+import threading
 import time
 import logging
 import base64
-import datetime
+import hashlib
 import uuid
-from typing import Dict, List, Optional, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterator, List, Optional, Tuple, Any
 
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from cryptography.hazmat.primitives import serialization, hashes
 from cryptography.hazmat.backends import default_backend
-from cryptography.hazmat.primitives.asymmetric import padding
+from cryptography.hazmat.primitives.asymmetric import padding, utils
+
+from kalshi.constants import CONFERENCE_SERIES_MAP, MAKE_TOURNAMENT_SERIES
+from kalshi.models import Contract
 
 
 BASE_URL = "https://demo-api.kalshi.co/trade-api/v2"
 
-MAKE_TOURNAMENT_SERIES = "KXMAKEMARMAD"
-
-CONFERENCE_SERIES_MAP = {
-    "SEC": "KXSECREG",
-    "Big 12": "KXBIG12REG",
-    "ACC": "KXACCREG",
-    "Big Ten": "KXBIG10REG",
-    "Big East": "KXBIGEASTREG",
-    "West Coast Conference": "KXWCCREG",
-    "Mountain West Conference": "KXMWREG",
-    "Atlantic 10 Conference": "KXA10REG",
-    "American Athletic Conference": "KXAACREG",
+# Tickers per /markets?tickers= request, and workers for the per-ticker fallback.
+# Kept low: past a handful of in-flight requests Kalshi queues or 429s, and the
+# retries cost more than the extra parallelism saves.
+PRICE_BATCH_SIZE = 100
+PRICE_FETCH_WORKERS = 5
+# Requests per minute allowed by the client-side token bucket, unless overridden.
+DEFAULT_RATE_LIMIT_RPM = 600
+# Keep-alive connections held per host; covers the price and series thread pools.
+HTTP_POOL_SIZE = 32
+
+# base field -> (cents field, dollars field), so reads don't format the name per call.
+_PRICE_FIELDS = {
+    base: (base, f"{base}_dollars")
+    for base in ("yes_bid", "yes_ask", "no_bid", "no_ask", "last_price")
 }
 
+# Signing parameters are immutable, so they are built once rather than per request.
+# The message is hashed with hashlib and handed to sign() as a Prehashed digest.
+_PSS_PADDING = padding.PSS(
+    mgf=padding.MGF1(hashes.SHA256()),
+    salt_length=padding.PSS.DIGEST_LENGTH,
+)
+_PREHASHED_SHA256 = utils.Prehashed(hashes.SHA256())
+_b64encode = base64.b64encode
+_METHOD_BYTES = {m: m.encode("ascii") for m in ("GET", "POST", "PUT", "DELETE")}
+
+# A signature for the same method and path is reused for this long. Kalshi accepts
+# timestamps well outside this window, and threaded fan-out hits one path in bursts.
+SIGNATURE_REUSE_MS = 500
+
+# Optional on-disk cache for public market-data GETs, so reruns minutes apart skip
+# the network. Series/event listings are stable intraday; anything looked up by
+# ticker is a price read and expires quickly. Authenticated calls are never cached.
+DEFAULT_CACHE_DIR = ".kalshi_cache"
+MARKET_LIST_CACHE_TTL = 300
+PRICE_CACHE_TTL = 10
+
+# Retries run inside urllib3: jittered exponential backoff from RETRY_BACKOFF_BASE,
+# capped at RETRY_BACKOFF_CAP, and Retry-After is honored on 429/503. POSTs are safe
+# to retry because orders carry a client_order_id that Kalshi deduplicates on.
+RETRY_BACKOFF_BASE = 0.25
+RETRY_BACKOFF_CAP = 4.0
+_RETRY = Retry(
+    total=3,
+    backoff_factor=RETRY_BACKOFF_BASE,
+    backoff_jitter=RETRY_BACKOFF_BASE,
+    backoff_max=RETRY_BACKOFF_CAP,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=frozenset({"GET", "POST", "DELETE"}),
+    raise_on_status=False,
+)
+
+
+def _as_float(value: Any) -> Optional[float]:
+    """float(value), or None for missing/blank/unparseable values; numbers skip the try."""
+    if isinstance(value, (int, float)):
+        return float(value)
+    if value is None or value == "":
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class _RateLimiter:
+    """Token bucket shared by every thread using a client; bursts up to one second's worth."""
+
+    def __init__(self, requests_per_minute: float):
+        self.rate = requests_per_minute / 60.0
+        self.capacity = max(1.0, self.rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, estimated_tokens: float = 1.0) -> None:
+        """Block until `estimated_tokens` are available, then take them."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= estimated_tokens:
+                    self._tokens -= estimated_tokens
+                    return
+                wait = (estimated_tokens - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+def _cache_ttl(path: str, params: Optional[Dict]) -> float:
+    if path == "/markets" and not (params or {}).get("tickers"):
+        return MARKET_LIST_CACHE_TTL
+    return PRICE_CACHE_TTL
+
 
 class KalshiClient:
-    def __init__(self, base_url: str = None):
+    def __init__(self, base_url: str = None, cache_dir: Optional[str] = None,
+                 cache_replay: bool = False, rate_limit_rpm: Optional[float] = None,
+                 cache_ttl: Optional[float] = None):
         self.logger = logging.getLogger(__name__)
         self.base_url = base_url or os.getenv("KALSHI_BASE_URL", BASE_URL)
         self.session = requests.Session()
+        # Price lookups and series fetches fan out across threads; size the pool to match
+        # so connections are reused.
+        adapter = HTTPAdapter(
+            pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE, max_retries=_RETRY
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        # Paces every outgoing request (cache hits are free); 0 disables it.
+        rpm = DEFAULT_RATE_LIMIT_RPM if rate_limit_rpm is None else rate_limit_rpm
+        self._rate_limiter = _RateLimiter(rpm) if rpm > 0 else None
         self.private_key = None
         self.api_key_id = os.getenv("KALSHI_KEY_ID", "")
+        # (method, path without query) -> (timestamp ms, timestamp str, signature)
+        self._sig_cache: Dict[Tuple[str, str], Tuple[int, str, str]] = {}
+        self._sig_lock = threading.Lock()
+
+        # cache_replay serves cached responses regardless of age and raises on a miss,
+        # so a rerun sees exactly the data an earlier run fetched.
+        if cache_replay and not cache_dir:
+            raise ValueError("cache_replay requires a cache_dir")
+        self.cache_dir = cache_dir
+        self.cache_replay = cache_replay
+        # One TTL for every cached GET, replacing the per-endpoint defaults; handy
+        # for stretching the cache while iterating on scripts.
+        if cache_ttl is None and os.getenv("KALSHI_CACHE_TTL"):
+            cache_ttl = float(os.environ["KALSHI_CACHE_TTL"])
+        self.cache_ttl = cache_ttl
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
 
         key_path = os.getenv("KALSHI_PRIVATE_KEY_PATH", "")
         if key_path and os.path.exists(key_path):
@@ -49,31 +167,86 @@ class KalshiClient:
         self.logger.info("Loaded private key from %s", key_path)
 
     def _sign_request(self, timestamp: str, method: str, path: str) -> str:
-        path_without_query = path.split("?")[0]
-        message = f"{timestamp}{method}{path_without_query}".encode("utf-8")
-        signature = self.private_key.sign(
-            message,
-            padding.PSS(
-                mgf=padding.MGF1(hashes.SHA256()),
-                salt_length=padding.PSS.DIGEST_LENGTH,
-            ),
-            hashes.SHA256(),
-        )
-        return base64.b64encode(signature).decode("utf-8")
+        path_without_query = path.partition("?")[0]
+        message = b"".join((
+            timestamp.encode("ascii"),
+            _METHOD_BYTES.get(method) or method.encode("ascii"),
+            path_without_query.encode("utf-8"),
+        ))
+        digest = hashlib.sha256(message).digest()
+        signature = self.private_key.sign(digest, _PSS_PADDING, _PREHASHED_SHA256)
+        # Base64 output is pure ASCII; requests wants str header values, so decode here.
+        return _b64encode(signature).decode("ascii")
 
     def _get_auth_headers(self, method: str, path: str) -> Dict[str, str]:
         if not self.private_key or not self.api_key_id:
             return {}
-        timestamp = str(int(datetime.datetime.now().timestamp() * 1000))
-        signature = self._sign_request(timestamp, method, path)
+        now_ms = time.time_ns() // 1_000_000
+        key = (method, path.partition("?")[0])
+        with self._sig_lock:
+            cached = self._sig_cache.get(key)
+        if cached and now_ms - cached[0] < SIGNATURE_REUSE_MS:
+            _, timestamp, signature = cached
+        else:
+            # Signed outside the lock so concurrent requests to other paths don't queue.
+            timestamp = str(now_ms)
+            signature = self._sign_request(timestamp, method, path)
+            with self._sig_lock:
+                if len(self._sig_cache) >= 256:
+                    # Per-order paths are unique; drop whatever has aged out.
+                    self._sig_cache = {
+                        k: v for k, v in self._sig_cache.items()
+                        if now_ms - v[0] < SIGNATURE_REUSE_MS
+                    }
+                self._sig_cache[key] = (now_ms, timestamp, signature)
+        # Always a fresh dict: _request adds Content-Type to it.
         return {
             "KALSHI-ACCESS-KEY": self.api_key_id,
             "KALSHI-ACCESS-SIGNATURE": signature,
             "KALSHI-ACCESS-TIMESTAMP": timestamp,
         }
 
-    def _get(self, path: str, params: Optional[Dict] = None, auth: bool = False) -> Optional[Dict]:
-        return self._request("GET", path, params=params, auth=auth)
+    def _get(
+        self, path: str, params: Optional[Dict] = None, auth: bool = False, cache: bool = True
+    ) -> Optional[Dict]:
+        if auth or not cache or not self.cache_dir:
+            return self._request("GET", path, params=params, auth=auth)
+
+        cache_path = self._cache_path(path, params)
+        ttl = self.cache_ttl if self.cache_ttl is not None else _cache_ttl(path, params)
+        data = self._read_cache(cache_path, ttl)
+        if data is not None:
+            return data
+        if self.cache_replay:
+            raise LookupError(f"No cached response for GET {path} {params or ''}")
+
+        data = self._request("GET", path, params=params)
+        if data is not None:
+            self._write_cache(cache_path, data)
+        return data
+
+    def _cache_path(self, path: str, params: Optional[Dict]) -> str:
+        key = orjson.dumps([self.base_url, path, params or {}], option=orjson.OPT_SORT_KEYS)
+        return os.path.join(self.cache_dir, hashlib.sha256(key).hexdigest() + ".json")
+
+    def _read_cache(self, cache_path: str, ttl: float) -> Optional[Dict]:
+        try:
+            if not self.cache_replay and time.time() - os.path.getmtime(cache_path) > ttl:
+                return None
+            with open(cache_path, "rb") as f:
+                return orjson.loads(f.read())
+        except (OSError, orjson.JSONDecodeError):
+            return None
+
+    def _write_cache(self, cache_path: str, data: Dict) -> None:
+        # Written to a temp file and renamed so a concurrent reader never sees half a file.
+        tmp_path = f"{cache_path}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(orjson.dumps(data))
+            os.replace(tmp_path, cache_path)
+        except OSError as exc:
+            self.logger.warning("Could not write Kalshi cache %s: %s", cache_path, exc)
 
     def _request(
         self,
@@ -87,37 +260,33 @@ class KalshiClient:
         headers: Dict[str, str] = {}
         if auth:
             headers = self._get_auth_headers(method.upper(), path)
+        body = None
+        if json_body is not None:
+            body = orjson.dumps(json_body)
+            headers["Content-Type"] = "application/json"
 
-        max_retries = 3
-        for attempt in range(max_retries):
-            try:
-                resp = self.session.request(
-                    method=method.upper(),
-                    url=url,
-                    params=params,
-                    json=json_body,
-                    headers=headers,
-                    timeout=30,
-                )
-                if resp.status_code == 429:
-                    wait = 2 ** attempt
-                    self.logger.warning("Rate limited, retrying in %ds...", wait)
-                    time.sleep(wait)
-                    continue
-                resp.raise_for_status()
-                if not resp.text:
-                    return {}
-                return resp.json()
-            except requests.RequestException as exc:
-                if attempt < max_retries - 1:
-                    time.sleep(2 ** attempt)
-                    continue
-                self.logger.error("%s %s failed: %s", method.upper(), url, exc)
-                return None
-        return None
+        if self._rate_limiter:
+            self._rate_limiter.acquire()
+        try:
+            resp = self.session.request(
+                method=method.upper(),
+                url=url,
+                params=params,
+                data=body,
+                headers=headers,
+                timeout=30,
+            )
+            resp.raise_for_status()
+            if not resp.content:
+                return {}
+            return orjson.loads(resp.content)
+        except (requests.RequestException, orjson.JSONDecodeError) as exc:
+            self.logger.error("%s %s failed: %s", method.upper(), url, exc)
+            return None
 
     def preflight_check(self) -> bool:
-        data = self._get("/markets", params={"limit": "1", "status": "open"})
+        # Always live: the point is to prove the API is reachable right now.
+        data = self._get("/markets", params={"limit": "1", "status": "open"}, cache=False)
         if data is None:
             return False
         markets = data.get("markets", [])
@@ -127,23 +296,25 @@ class KalshiClient:
         self.logger.info("Preflight: API reachable, got %d market(s)", len(markets))
         return True
 
-    def _fetch_all_markets(self, params: Dict) -> List[Dict]:
-        all_markets: List[Dict] = []
+    def _iter_markets(self, params: Dict) -> Iterator[Dict]:
+        """Yield /markets results page by page, following the cursor."""
+        # One copy up front (callers may reuse their dict); only the cursor changes per page.
+        req_params = {**params, "limit": "200"}
         cursor = None
         while True:
-            req_params = dict(params)
-            req_params["limit"] = "200"
             if cursor:
                 req_params["cursor"] = cursor
             data = self._get("/markets", params=req_params)
             if data is None:
-                break
+                return
             markets = data.get("markets", [])
-            all_markets.extend(markets)
+            yield from markets
             cursor = data.get("cursor", "")
             if not cursor or not markets:
-                break
-        return all_markets
+                return
+
+    def _fetch_all_markets(self, params: Dict) -> List[Dict]:
+        return list(self._iter_markets(params))
 
     def get_markets_by_series(self, series_ticker: str, status: str = "open") -> List[Dict]:
         params = {"series_ticker": series_ticker, "status": status}
@@ -153,36 +324,38 @@ class KalshiClient:
         params = {"event_ticker": event_ticker, "status": status}
         return self._fetch_all_markets(params)
 
-    def get_make_tournament_markets(self) -> List[Dict]:
+    def _contract_row(self, m: Dict[str, Any]) -> Optional[Contract]:
+        """Flatten a raw /markets entry into a Contract; None if no team name is found."""
+        get = m.get
+        team_name = get("yes_sub_title", "") or self._extract_team_from_ticker(get("ticker", ""))
+        if not team_name:
+            return None
+
+        read_price = self._read_price
+        return Contract(
+            ticker=m["ticker"],
+            title=get("title", ""),
+            team_name=team_name,
+            yes_price=read_price(m, "yes_bid"),
+            no_price=read_price(m, "no_bid"),
+            yes_ask=read_price(m, "yes_ask"),
+            no_ask=read_price(m, "no_ask"),
+            last_price=read_price(m, "last_price"),
+            volume=get("volume", 0),
+            status=get("status", ""),
+            event_ticker=get("event_ticker", ""),
+        )
+
+    def get_make_tournament_markets(self) -> List[Contract]:
         raw_markets = self.get_markets_by_series(MAKE_TOURNAMENT_SERIES)
         self.logger.info("Fetched %d raw Make Tournament markets", len(raw_markets))
 
-        results: List[Dict] = []
-        for m in raw_markets:
-            team_name = m.get("yes_sub_title", "")
-            if not team_name:
-                team_name = self._extract_team_from_ticker(m.get("ticker", ""))
-            if not team_name:
-                continue
-
-            results.append({
-                "ticker": m["ticker"],
-                "title": m.get("title", ""),
-                "team_name": team_name,
-                "yes_price": self._read_price(m, "yes_bid"),
-                "no_price": self._read_price(m, "no_bid"),
-                "yes_ask": self._read_price(m, "yes_ask"),
-                "no_ask": self._read_price(m, "no_ask"),
-                "last_price": self._read_price(m, "last_price"),
-                "volume": m.get("volume", 0),
-                "status": m.get("status", ""),
-                "event_ticker": m.get("event_ticker", ""),
-            })
+        results = [row for row in map(self._contract_row, raw_markets) if row]
 
         self.logger.info("Parsed %d Make Tournament markets with team names", len(results))
         return results
 
-    def get_conference_markets(self, conference: str) -> List[Dict]:
+    def get_conference_markets(self, conference: str) -> List[Contract]:
         series_ticker = CONFERENCE_SERIES_MAP.get(conference)
         if not series_ticker:
             self.logger.warning("No series ticker mapped for conference: %s", conference)
@@ -191,27 +364,7 @@ class KalshiClient:
         raw_markets = self.get_markets_by_series(series_ticker)
         self.logger.info("Fetched %d raw %s conference markets", len(raw_markets), conference)
 
-        results: List[Dict] = []
-        for m in raw_markets:
-            team_name = m.get("yes_sub_title", "")
-            if not team_name:
-                team_name = self._extract_team_from_ticker(m.get("ticker", ""))
-            if not team_name:
-                continue
-
-            results.append({
-                "ticker": m["ticker"],
-                "title": m.get("title", ""),
-                "team_name": team_name,
-                "yes_price": self._read_price(m, "yes_bid"),
-                "no_price": self._read_price(m, "no_bid"),
-                "yes_ask": self._read_price(m, "yes_ask"),
-                "no_ask": self._read_price(m, "no_ask"),
-                "last_price": self._read_price(m, "last_price"),
-                "volume": m.get("volume", 0),
-                "status": m.get("status", ""),
-                "event_ticker": m.get("event_ticker", ""),
-            })
+        results = [row for row in map(self._contract_row, raw_markets) if row]
 
         return results
 
@@ -219,7 +372,30 @@ class KalshiClient:
         data = self._get(f"/markets/{ticker}")
         if data is None:
             return {}
-        market = data.get("market", {})
+        return self._market_prices(data.get("market", {}))
+
+    def get_market_prices_batch(self, tickers: List[str]) -> Dict[str, Dict]:
+        """
+        Fetch prices for many tickers using the multi-ticker /markets filter.
+        Tickers the batch call does not return are fetched individually in
+        parallel so callers always get an entry for every requested ticker.
+        """
+        unique = list(dict.fromkeys(t for t in tickers if t))
+        prices: Dict[str, Dict] = {}
+        for i in range(0, len(unique), PRICE_BATCH_SIZE):
+            chunk = unique[i:i + PRICE_BATCH_SIZE]
+            for market in self._fetch_all_markets({"tickers": ",".join(chunk)}):
+                ticker = market.get("ticker")
+                if ticker:
+                    prices[ticker] = self._market_prices(market)
+
+        missing = [t for t in unique if t not in prices]
+        if missing:
+            with ThreadPoolExecutor(max_workers=PRICE_FETCH_WORKERS) as executor:
+                prices.update(zip(missing, executor.map(self.get_market_prices, missing)))
+        return prices
+
+    def _market_prices(self, market: Dict[str, Any]) -> Dict:
         return {
             "yes_buy_price": self._read_price(market, "yes_ask"),
             "no_buy_price": self._read_price(market, "no_ask"),
@@ -243,36 +419,48 @@ class KalshiClient:
         return data.get("orderbook", {})
 
     def get_markets_by_title(self, search_term: str, status: str = "open") -> List[Dict]:
-        all_markets = self._fetch_all_markets({"status": status})
-        term_lower = search_term.lower()
-        return [
-            m for m in all_markets
-            if term_lower in m.get("title", "").lower()
-            or term_lower in m.get("yes_sub_title", "").lower()
-        ]
-
-    def _extract_team_from_ticker(self, ticker: str) -> str:
+        return self.get_markets_by_titles([search_term], status)[search_term]
+
+    def iter_markets_by_title(self, search_term: str, status: str = "open") -> Iterator[Dict]:
+        """Yield matching markets as pages arrive; stop iterating to stop fetching pages."""
+        term = search_term.lower()
+        for m in self._iter_markets({"status": status}):
+            if term in m.get("title", "").lower() or term in m.get("yes_sub_title", "").lower():
+                yield m
+
+    def get_markets_by_titles(self, search_terms: List[str], status: str = "open") -> Dict[str, List[Dict]]:
+        """Match several terms against one scan of the open markets, keyed by term."""
+        terms = [(term, term.lower()) for term in dict.fromkeys(search_terms)]
+        results: Dict[str, List[Dict]] = {term: [] for term in search_terms}
+        # Filtered as pages arrive: only matches are kept, never the full listing.
+        for m in self._iter_markets({"status": status}):
+            # Lowered once per market, however many terms are searched.
+            title = m.get("title", "").lower()
+            yes_sub_title = m.get("yes_sub_title", "").lower()
+            for term, term_lower in terms:
+                if term_lower in title or term_lower in yes_sub_title:
+                    results[term].append(m)
+        return results
+
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _extract_team_from_ticker(ticker: str) -> str:
+        # The ticker universe is stable across polls, so each one is split once.
         parts = ticker.rsplit("-", 1)
         if len(parts) == 2:
             return parts[1]
         return ""
 
     def _read_price(self, market: Dict[str, Any], base_field: str) -> float:
-        dollars_field = f"{base_field}_dollars"
-        if dollars_field in market and market[dollars_field] not in (None, ""):
-            try:
-                value = float(market[dollars_field])
-                return max(0.0, min(1.0, value))
-            except (TypeError, ValueError):
-                pass
-
-        raw = market.get(base_field, 0)
-        try:
-            value = float(raw)
-        except (TypeError, ValueError):
-            return 0.0
-        if value > 1.0:
-            return max(0.0, min(1.0, value / 100.0))
+        cents_field, dollars_field = _PRICE_FIELDS[base_field]
+        value = _as_float(market.get(dollars_field))
+        if value is None:
+            value = _as_float(market.get(cents_field, 0))
+            if value is None:
+                return 0.0
+            # Legacy cents payload.
+            if value > 1.0:
+                value /= 100.0
         return max(0.0, min(1.0, value))
 
     def can_auth_trade(self) -> bool:
@@ -326,21 +514,35 @@ class KalshiClient:
         }
         return self._request("POST", "/portfolio/orders", json_body=payload, auth=True)
 
-    def get_open_orders(self) -> List[Dict[str, Any]]:
+    def iter_open_orders(self) -> Iterator[Dict[str, Any]]:
+        """Yield resting orders page by page, following the cursor."""
         if not self.can_auth_trade():
-            return []
-        data = self._request(
-            "GET",
-            "/portfolio/orders",
-            params={"status": "resting", "limit": "200"},
-            auth=True,
-        )
-        if data is None:
-            return []
-        return data.get("orders", [])
+            return
+        cursor = None
+        while True:
+            params = {"status": "resting", "limit": "200"}
+            if cursor:
+                params["cursor"] = cursor
+            data = self._request("GET", "/portfolio/orders", params=params, auth=True)
+            if data is None:
+                return
+            orders = data.get("orders", [])
+            yield from orders
+            cursor = data.get("cursor", "")
+            if not cursor or not orders:
+                return
+
+    def get_open_orders(self) -> List[Dict[str, Any]]:
+        return list(self.iter_open_orders())
 
     def cancel_order(self, order_id: str) -> bool:
         if not self.can_auth_trade():
             return False
         data = self._request("DELETE", f"/portfolio/orders/{order_id}", auth=True)
         return data is not None
+
+
+@functools.lru_cache(maxsize=1)
+def default_client() -> KalshiClient:
+    """Shared client with the disk cache on: one key load and one connection pool per process."""
+    return KalshiClient(cache_dir=DEFAULT_CACHE_DIR)
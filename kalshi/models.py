@@ -0,0 +1,19 @@
+"""Typed records for Kalshi market data."""
+
+from dataclasses import dataclass
+
+
+@dataclass(slots=True, frozen=True)
+class Contract:
+    """One tradable Kalshi contract; prices are in dollars (0-1)."""
+    ticker: str
+    title: str
+    team_name: str
+    yes_price: float
+    no_price: float
+    yes_ask: float = 0.0
+    no_ask: float = 0.0
+    last_price: float = 0.0
+    volume: int = 0
+    status: str = ""
+    event_ticker: str = ""
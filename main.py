@@ -3,20 +3,22 @@
 import argparse
 import logging
 import sys
+from concurrent.futures import Executor, ThreadPoolExecutor
 from datetime import datetime, timezone
+from operator import attrgetter
 from pathlib import Path
 
 from config import Config
-from browser import BrowserClient
-from scrapers.schedule_scraper import ScheduleScraper
-from scrapers.tourneycast_scraper import TourneyCastScraper
-from scrapers.concast_scraper import ConCastScraper
-from kalshi.kalshi_client import KalshiClient
+from browser import BrowserClient, BrowserPool
+from kalshi.kalshi_client import DEFAULT_CACHE_DIR, PRICE_FETCH_WORKERS, KalshiClient
 from matcher import TeamMatcher
 from ev import EVCalculator
 from output import OutputManager
 from autotrader import AutoTrader, AutotradeConfig
 
+# Concurrent BartTorvik page loads, each in its own headless Chrome
+SCRAPE_WORKERS = 4
+
 def setup_logging(verbose: bool = False):
     """Setup logging configuration"""
     logging.basicConfig(
@@ -52,6 +54,9 @@ def parse_arguments():
     parser.add_argument('--kill-switch-file', type=str, default='autotrader.stop', help='Kill switch file path')
     parser.add_argument('--schedule-timezone', type=str, default='America/Chicago', help='Timezone of scraped game times')
     parser.add_argument('--cancel-maker-at-tipoff', action='store_true', help='Cancel maker orders at first game tipoff')
+    cache_group = parser.add_mutually_exclusive_group()
+    cache_group.add_argument('--no-cache', action='store_true', help='Always fetch fresh Kalshi market data')
+    cache_group.add_argument('--cache-replay', action='store_true', help='Serve Kalshi market data only from the cache; fail on a miss')
     
     return parser.parse_args()
 
@@ -69,17 +74,22 @@ def parse_date(date_str: str) -> datetime:
 
 def scrape_tourneycast(browser_client: BrowserClient) -> list:
     """Scrape TourneyCast data"""
+    # Scrapers pull in lxml; importing them here keeps --help and preflight
+    # failures from paying for it.
+    from scrapers.tourneycast_scraper import TourneyCastScraper
     scraper = TourneyCastScraper(browser_client)
     return scraper.scrape_tourney_probabilities()
 
-def scrape_conference_odds(browser_client: BrowserClient, config: Config) -> dict:
-    """Scrape conference championship odds"""
-    scraper = ConCastScraper(browser_client)
-    conference_data = {}
+def scrape_conference_odds(browser_pool: BrowserPool, config: Config, executor: Executor) -> dict:
+    """Scrape conference championship odds, one conference per worker"""
+    from scrapers.concast_scraper import ConCastScraper
+    
+    def scrape_one(conference: str) -> list:
+        scraper = ConCastScraper(browser_pool.get())
+        return scraper.scrape_conference_odds(config.get_conference_code(conference))
     
-    for conference in config.conferences:
-        conf_code = config.get_conference_code(conference)
-        teams = scraper.scrape_conference_odds(conf_code)
+    conference_data = {}
+    for conference, teams in zip(config.conferences, executor.map(scrape_one, config.conferences)):
         if teams:
             conference_data[conference] = teams
     
@@ -87,19 +97,25 @@ def scrape_conference_odds(browser_client: BrowserClient, config: Config) -> dic
 
 def scrape_games(browser_client: BrowserClient, target_date: datetime) -> list:
     """Scrape game schedule"""
+    from scrapers.schedule_scraper import ScheduleScraper
     scraper = ScheduleScraper(browser_client)
     return scraper.scrape_games(target_date)
 
 def get_kalshi_markets(config: Config, kalshi_client: KalshiClient) -> tuple:
     """Get Kalshi markets and contracts using production API"""
     
-    make_tournament_contracts = kalshi_client.get_make_tournament_markets()
-    
-    conference_markets = {}
-    for conference in config.conferences:
-        contracts = kalshi_client.get_conference_markets(conference)
-        if contracts:
-            conference_markets[conference] = contracts
+    # Each series paginates on its own cursor, so the series are fetched side by side
+    # rather than one after another; results keep config.conferences order.
+    workers = min(len(config.conferences) + 1, PRICE_FETCH_WORKERS)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        make_future = executor.submit(kalshi_client.get_make_tournament_markets)
+        conf_results = executor.map(kalshi_client.get_conference_markets, config.conferences)
+        
+        conference_markets = {}
+        for conference, contracts in zip(config.conferences, conf_results):
+            if contracts:
+                conference_markets[conference] = contracts
+        make_tournament_contracts = make_future.result()
     
     return make_tournament_contracts, conference_markets
 
@@ -138,8 +154,17 @@ def main():
     matcher = TeamMatcher()
     output_manager = OutputManager(output_dir)
     
-    # Initialize Kalshi client and do preflight check
-    kalshi_client = KalshiClient()
+    # Initialize Kalshi client and do preflight check. Cached market data is for
+    # fast reruns; real orders are always priced off fresh data.
+    if args.cache_replay and args.live_orders:
+        logger.error("--cache-replay cannot be combined with --live-orders")
+        sys.exit(1)
+    use_cache = not (args.no_cache or args.live_orders)
+    kalshi_client = KalshiClient(
+        cache_dir=DEFAULT_CACHE_DIR if use_cache else None,
+        cache_replay=args.cache_replay,
+        rate_limit_rpm=config.kalshi.get('rpm')
+    )
     logger.info("Performing Kalshi API preflight check...")
     if not kalshi_client.preflight_check():
         logger.error("Kalshi API preflight check failed - aborting")
@@ -174,26 +199,24 @@ def main():
         # Scrape data from BartTorvik
         logger.info("Scraping BartTorvik data...")
         
-        with BrowserClient(
+        # The pages are independent, so they load side by side; every worker
+        # thread drives its own browser, so SCRAPE_WORKERS caps open Chromes.
+        with BrowserPool(
             headless=config.scraping['headless'],
             timeout=config.scraping['timeout'],
             screenshot_dir=screenshot_dir
-        ) as browser:
+        ) as browsers, ThreadPoolExecutor(max_workers=SCRAPE_WORKERS) as executor:
             
-            # Scrape TourneyCast
-            logger.info("Scraping TourneyCast...")
-            tourney_teams = scrape_tourneycast(browser)
-            log_messages.append(f"TourneyCast: Found {len(tourney_teams)} teams")
+            logger.info("Scraping TourneyCast, conference championship odds and game schedule...")
+            tourney_future = executor.submit(lambda: scrape_tourneycast(browsers.get()))
+            games_future = executor.submit(lambda: scrape_games(browsers.get(), target_date))
+            conference_data = scrape_conference_odds(browsers, config, executor)
+            tourney_teams = tourney_future.result()
+            games = games_future.result()
             
-            # Scrape conference odds
-            logger.info("Scraping conference championship odds...")
-            conference_data = scrape_conference_odds(browser, config)
+            log_messages.append(f"TourneyCast: Found {len(tourney_teams)} teams")
             total_conf_teams = sum(len(teams) for teams in conference_data.values())
             log_messages.append(f"Conference odds: Found {total_conf_teams} teams across {len(conference_data)} conferences")
-            
-            # Scrape games
-            logger.info("Scraping game schedule...")
-            games = scrape_games(browser, target_date)
             log_messages.append(f"Games: Found {len(games)} games for {target_date.strftime('%Y-%m-%d')}")
         
         # Get Kalshi markets
@@ -226,12 +249,13 @@ def main():
                 all_bets.extend(conf_bets)
                 log_messages.append(f"{conference} bets: {len(conf_bets)} qualifying")
         
-        # Sort all bets by EV
-        all_bets.sort(key=lambda x: x.ev, reverse=True)
+        # Sort all bets by EV. The full order is kept: CSV/JSON and the autotrader use
+        # every bet, and each per-market list is already sorted, so this mostly merges runs.
+        all_bets.sort(key=attrgetter("ev"), reverse=True)
         
         # Generate output
         logger.info("Generating reports...")
-        output_manager.generate_report(all_bets, log_messages)
+        report_stats = output_manager.generate_report(all_bets, log_messages)
 
         # Optional autotrader execution
         if args.autotrade:
@@ -272,10 +296,11 @@ def main():
         
         # Print summary
         print(f"\n✅ Analysis complete!")
-        print(f"📊 Total qualifying bets: {len(all_bets)}")
+        num_bets = len(all_bets)
+        print(f"📊 Total qualifying bets: {num_bets}")
         if all_bets:
             print(f"💰 Best EV: ${all_bets[0].ev:.3f}")
-            print(f"📈 Average EV: ${sum(bet.ev for bet in all_bets) / len(all_bets):.3f}")
+            print(f"📈 Average EV: ${report_stats.total_ev / num_bets:.3f}")
         
         logger.info("Kalshi Best Bets completed successfully")
         
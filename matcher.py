@@ -1,19 +1,24 @@
+import csv
 import re
+import sys
+from collections import defaultdict
 from rapidfuzz import fuzz, process
-from typing import List, Dict, Tuple, Optional
+from typing import Any, DefaultDict, Dict, List, Sequence, Set, Tuple
 import logging
-import pandas as pd
+import numpy as np
 from pathlib import Path
 
+from kalshi.models import Contract
+
 class TeamMatcher:
-    def __init__(self, min_score: int = 90):
+    def __init__(self, min_score: int = 90) -> None:
         self.min_score = min_score
         self.logger = logging.getLogger(__name__)
-        self.unmatched_teams = []
-        self.unmatched_contracts = []
+        self.unmatched_teams: List[Dict[str, Any]] = []
+        self.unmatched_contracts: List[Dict[str, Any]] = []
         
         # Team name normalization mappings
-        self.team_normalizations = {
+        self.team_normalizations: Dict[str, str] = {
             'St.': 'State',
             'St ': 'State ',
             'UConn': 'Connecticut',
@@ -60,62 +65,82 @@ class TeamMatcher:
             'College of Charleston': 'Charleston',
             'William & Mary': 'William and Mary',
         }
+        # Lowercased once here instead of on every call. Order matters: later
+        # replacements apply to the output of earlier ones.
+        self._lower_normalizations: Tuple[Tuple[str, str], ...] = tuple(
+            (old.lower(), new.lower()) for old, new in self.team_normalizations.items()
+        )
+        self._normalized_cache: Dict[str, str] = {}
+    
+    # Punctuation and whitespace together are exactly \W, so one pass turns every
+    # run of either into a single space.
+    _NON_WORD_RE = re.compile(r'\W+')
     
     def normalize_team_name(self, name: str) -> str:
         """Normalize team name for matching"""
         if not name:
             return ""
         
+        # The same team and contract names come through every match pass
+        cached = self._normalized_cache.get(name)
+        if cached is not None:
+            return cached
+        
         # Convert to lowercase and strip
-        name = name.lower().strip()
+        normalized = name.lower().strip()
         
         # Apply normalizations
-        for old, new in self.team_normalizations.items():
-            name = name.replace(old.lower(), new.lower())
+        for old, new in self._lower_normalizations:
+            if old in normalized:
+                normalized = normalized.replace(old, new)
         
         # Remove common punctuation and extra spaces
-        name = re.sub(r'[^\w\s]', ' ', name)
-        name = re.sub(r'\s+', ' ', name)
+        # Interned so every occurrence of a name is one object: equality checks on
+        # repeats short-circuit on identity and unmatched rows share the string.
+        normalized = sys.intern(self._NON_WORD_RE.sub(' ', normalized).strip())
         
-        return name.strip()
+        self._normalized_cache[name] = normalized
+        return normalized
     
-    def match_teams_to_contracts(self, teams: List[Dict], contracts: List[Dict], 
-                                output_dir: Path) -> List[Dict]:
+    def match_teams_to_contracts(self, teams: List[Dict[str, Any]], contracts: List[Contract], 
+                                output_dir: Path) -> List[Dict[str, Any]]:
         """Match teams to Kalshi contracts"""
-        matched_bets = []
+        matched_bets: List[Dict[str, Any]] = []
         
-        # Create list of team names for fuzzy matching
+        # Normalize every name once; the loops below only index into these lists
         team_names = [self.normalize_team_name(team['team']) for team in teams]
-        contract_names = [self.normalize_team_name(contract['team_name']) for contract in contracts]
+        contract_names = [self.normalize_team_name(contract.team_name) for contract in contracts]
+        matched_idx: Set[int] = set()
         
-        # Match each team to best contract
-        for i, team in enumerate(teams):
-            team_name_norm = self.normalize_team_name(team['team'])
-            
-            # Find best match using rapidfuzz
-            result = process.extractOne(
-                team_name_norm, 
+        # Score every team against every contract in one C call (rows: teams, cols: contracts).
+        # Below-cutoff scores come back as 0; float64 keeps scores identical to extractOne's.
+        if team_names and contract_names:
+            scores = process.cdist(
+                team_names,
                 contract_names,
                 scorer=fuzz.token_set_ratio,
-                score_cutoff=self.min_score
+                processor=None,
+                score_cutoff=self.min_score,
+                dtype=np.float64,
+                workers=-1
             )
+            best_indices = scores.argmax(axis=1)
+        
+        # Match each team to best contract
+        for i, (team, team_name_norm) in enumerate(zip(teams, team_names)):
+            # argmax picks the first of equal scores, as extractOne does
+            score = 0.0
+            if contract_names:
+                best_match_idx = int(best_indices[i])
+                score = float(scores[i, best_match_idx])
             
-            if result:
-                matched_name, score, best_match_idx = result
-                # Ensure best_match_idx is an integer
-                if isinstance(best_match_idx, str):
-                    # Find the actual index by searching contract names
-                    try:
-                        best_match_idx = contract_names.index(matched_name)
-                    except ValueError:
-                        self.logger.warning(f"Could not find index for matched name: {matched_name}")
-                        continue
-                
+            if contract_names and score >= self.min_score:
+                matched_idx.add(best_match_idx)
                 contract = contracts[best_match_idx]
                 
                 # Log low-scoring matches
                 if score < 95:
-                    self.logger.warning(f"Low score match: {team['team']} -> {contract['team_name']} (score: {score})")
+                    self.logger.warning(f"Low score match: {team['team']} -> {contract.team_name} (score: {score})")
                 
                 matched_bet = {
                     'team': team['team'],
@@ -133,15 +158,12 @@ class TeamMatcher:
                 })
         
         # Find contracts that weren't matched
-        matched_contract_names = {self.normalize_team_name(bet['contract']['team_name']) for bet in matched_bets}
-        
-        for contract in contracts:
-            contract_name_norm = self.normalize_team_name(contract['team_name'])
-            if contract_name_norm not in matched_contract_names:
+        for i, contract in enumerate(contracts):
+            if i not in matched_idx:
                 self.unmatched_contracts.append({
-                    'contract': contract['team_name'],
-                    'normalized': contract_name_norm,
-                    'ticker': contract.get('ticker', ''),
+                    'contract': contract.team_name,
+                    'normalized': contract_names[i],
+                    'ticker': contract.ticker,
                     'reason': 'No team match found'
                 })
         
@@ -154,25 +176,48 @@ class TeamMatcher:
         
         return matched_bets
     
-    def match_game_markets(self, games: List[Dict], markets: List[Dict], 
-                          output_dir: Path) -> List[Dict]:
+    def match_game_markets(self, games: List[Dict[str, Any]], markets: List[Dict[str, Any]], 
+                          output_dir: Path) -> List[Dict[str, Any]]:
         """Match games to Kalshi game winner markets"""
-        matched_games = []
+        matched_games: List[Dict[str, Any]] = []
+        
+        # Lowercase market texts once rather than once per game
+        market_texts = [
+            (market, market.get('title', '').lower(), market.get('subtitle', '').lower())
+            for market in markets
+        ]
+        
+        # Trigram -> indices of markets whose title or subtitle contains it. A substring
+        # of a text has all its trigrams in the text, so intersecting postings yields
+        # every market the substring check below could accept, and usually little else.
+        trigram_index: DefaultDict[str, Set[int]] = defaultdict(set)
+        for i, (_, market_title, market_subtitle) in enumerate(market_texts):
+            for gram in self._trigrams(market_title) | self._trigrams(market_subtitle):
+                trigram_index[gram].add(i)
         
         for game in games:
             away_team = game['away_team']
             home_team = game['home_team']
+            away_norm = self.normalize_team_name(away_team)
+            home_norm = self.normalize_team_name(home_team)
             
             # Search for markets containing both team names
-            matching_markets = []
+            matching_markets: List[Dict[str, Any]] = []
+            candidates: Sequence[int]
             
-            for market in markets:
-                market_title = market.get('title', '').lower()
-                market_subtitle = market.get('subtitle', '').lower()
-                
-                away_norm = self.normalize_team_name(away_team)
-                home_norm = self.normalize_team_name(home_team)
-                
+            if len(away_norm) < 3 or len(home_norm) < 3:
+                # Too short to have trigrams; every market is a candidate
+                candidates = range(len(market_texts))
+            else:
+                postings = sorted(
+                    (trigram_index.get(gram, set())
+                     for gram in self._trigrams(away_norm) | self._trigrams(home_norm)),
+                    key=len
+                )
+                candidates = sorted(set.intersection(*postings))
+            
+            for i in candidates:
+                market, market_title, market_subtitle = market_texts[i]
                 # Check if both team names are in market
                 if (away_norm in market_title and home_norm in market_title) or \
                    (away_norm in market_subtitle and home_norm in market_subtitle):
@@ -203,12 +248,25 @@ class TeamMatcher:
         self.logger.info(f"Matched {len(matched_games)} games to markets")
         return matched_games
     
-    def _save_unmatched_data(self, output_dir: Path):
+    @staticmethod
+    def _trigrams(text: str) -> Set[str]:
+        """Set of 3-character substrings of text"""
+        return {text[i:i + 3] for i in range(len(text) - 2)}
+    
+    def _save_unmatched_data(self, output_dir: Path) -> None:
         """Save unmatched teams and contracts to CSV files"""
         if self.unmatched_teams:
-            teams_df = pd.DataFrame(self.unmatched_teams)
-            teams_df.to_csv(output_dir / "unmatched_teams.csv", index=False)
+            self._write_csv(output_dir / "unmatched_teams.csv", self.unmatched_teams)
         
         if self.unmatched_contracts:
-            contracts_df = pd.DataFrame(self.unmatched_contracts)
-            contracts_df.to_csv(output_dir / "unmatched_contracts.csv", index=False)
+            self._write_csv(output_dir / "unmatched_contracts.csv", self.unmatched_contracts)
+    
+    @staticmethod
+    def _write_csv(path: Path, rows: List[Dict[str, Any]]) -> None:
+        """Write dict rows to CSV; columns are the union of keys in first-seen order"""
+        # Game and team entries carry different keys, so the header can't come from rows[0]
+        fieldnames = list(dict.fromkeys(key for row in rows for key in row))
+        with open(path, 'w', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=fieldnames)
+            writer.writeheader()
+            writer.writerows(rows)
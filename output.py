@@ -1,14 +1,62 @@
-import json
 import csv
-import pandas as pd
+import math
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, NamedTuple, Optional
 import logging
-from tabulate import tabulate
+import orjson
 
 from ev import Bet
 
+class BetAggregates(NamedTuple):
+    total_ev: float
+    min_ev: float
+    max_ev: float
+    per_market: Dict[str, Dict]
+
+def _aggregate(bets: List[Bet]) -> BetAggregates:
+    """Overall EV total/min/max and per-market-type stats in a single pass over bets"""
+    total = 0.0
+    mn = math.inf
+    mx = -math.inf
+    per_market: Dict[str, Dict] = {}
+    for bet in bets:
+        ev = bet.ev
+        total += ev
+        if ev < mn:
+            mn = ev
+        if ev > mx:
+            mx = ev
+        
+        stats = per_market.get(bet.market_type)
+        if stats is None:
+            stats = per_market[bet.market_type] = {
+                'count': 0,
+                'total_ev': 0,
+                'avg_ev': 0,
+                'max_ev': 0,
+                'min_ev': math.inf
+            }
+        stats['count'] += 1
+        stats['total_ev'] += ev
+        if ev > stats['max_ev']:
+            stats['max_ev'] = ev
+        if ev < stats['min_ev']:
+            stats['min_ev'] = ev
+    
+    # Calculate averages
+    for stats in per_market.values():
+        stats['avg_ev'] = stats['total_ev'] / stats['count']
+        if stats['min_ev'] == math.inf:
+            stats['min_ev'] = 0
+    
+    return BetAggregates(total, mn, mx, per_market)
+
+_CSV_FIELDS = (
+    'market_type', 'league_conf', 'description', 'model_prob_or_exp_payout', 'yes_price',
+    'ev', 'edge', 'contract_ticker', 'team_name', 'timestamp'
+)
+
 class OutputManager:
     def __init__(self, output_dir: Path):
         self.output_dir = output_dir
@@ -49,6 +97,8 @@ class OutputManager:
         
         print(f"\n🏀 TOP {len(top_bets)} KALSHI BEST BETS 🏀")
         print("=" * 80)
+        # Only the console table needs tabulate; file-only callers skip the import
+        from tabulate import tabulate
         print(tabulate(table_data, headers=headers, tablefmt="grid"))
         print(f"\nTotal qualifying bets: {len(bets)}")
         print(f"Showing top {len(top_bets)} bets")
@@ -61,28 +111,23 @@ class OutputManager:
         
         csv_path = self.output_dir / filename
         
-        # Prepare data for CSV
-        csv_data = []
-        for bet in bets:
-            csv_data.append({
-                'market_type': bet.market_type,
-                'league_conf': bet.league_conf,
-                'description': bet.description,
-                'model_prob_or_exp_payout': bet.model_prob_or_exp_payout,
-                'yes_price': bet.yes_price,
-                'ev': bet.ev,
-                'edge': bet.edge,
-                'contract_ticker': bet.contract_ticker,
-                'team_name': bet.team_name,
-                'timestamp': datetime.now().isoformat()
-            })
-        
-        df = pd.DataFrame(csv_data)
-        df.to_csv(csv_path, index=False)
+        # One timestamp for the whole file; rows are plain tuples, no per-bet dict
+        timestamp = datetime.now().isoformat()
+        rows = [
+            (bet.market_type, bet.league_conf, bet.description, bet.model_prob_or_exp_payout,
+             bet.yes_price, bet.ev, bet.edge, bet.contract_ticker, bet.team_name, timestamp)
+            for bet in bets
+        ]
+        
+        with open(csv_path, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(_CSV_FIELDS)
+            writer.writerows(rows)
         
         self.logger.info(f"Saved {len(bets)} bets to {csv_path}")
     
-    def save_bets_json(self, bets: List[Bet], filename: str = "best_bets.json"):
+    def save_bets_json(self, bets: List[Bet], filename: str = "best_bets.json",
+                       aggregates: Optional[BetAggregates] = None):
         """Save bets to JSON file"""
         if not bets:
             self.logger.warning("No bets to save to JSON")
@@ -90,33 +135,22 @@ class OutputManager:
         
         json_path = self.output_dir / filename
         
-        # Convert bets to dict format
-        bets_data = []
-        for bet in bets:
-            bets_data.append({
-                'market_type': bet.market_type,
-                'league_conf': bet.league_conf,
-                'description': bet.description,
-                'model_prob_or_exp_payout': bet.model_prob_or_exp_payout,
-                'yes_price': bet.yes_price,
-                'ev': bet.ev,
-                'edge': bet.edge,
-                'contract_ticker': bet.contract_ticker,
-                'team_name': bet.team_name
-            })
+        if aggregates is None:
+            aggregates = _aggregate(bets)
         
         # Add metadata
         output_data = {
             'timestamp': datetime.now().isoformat(),
             'total_bets': len(bets),
-            'min_ev': min(bet.ev for bet in bets) if bets else 0,
-            'max_ev': max(bet.ev for bet in bets) if bets else 0,
-            'avg_ev': sum(bet.ev for bet in bets) / len(bets) if bets else 0,
-            'bets': bets_data
+            'min_ev': aggregates.min_ev,
+            'max_ev': aggregates.max_ev,
+            'avg_ev': aggregates.total_ev / len(bets),
+            # orjson serializes Bet dataclasses natively, fields in declaration order
+            'bets': bets
         }
         
-        with open(json_path, 'w') as f:
-            json.dump(output_data, f, indent=2)
+        with open(json_path, 'wb') as f:
+            f.write(orjson.dumps(output_data, option=orjson.OPT_INDENT_2))
         
         self.logger.info(f"Saved {len(bets)} bets to {json_path}")
     
@@ -124,65 +158,45 @@ class OutputManager:
         """Save log messages to file"""
         log_path = self.output_dir / filename
         
+        # Built up front and written once; f-strings keep non-str messages working
+        lines = [f"Kalshi Best Bets Log - {datetime.now().isoformat()}\n", "=" * 50 + "\n\n"]
+        lines.extend(f"{message}\n" for message in log_messages)
+        
         with open(log_path, 'w') as f:
-            f.write(f"Kalshi Best Bets Log - {datetime.now().isoformat()}\n")
-            f.write("=" * 50 + "\n\n")
-            
-            for message in log_messages:
-                f.write(f"{message}\n")
+            f.write("".join(lines))
         
         self.logger.info(f"Saved log to {log_path}")
     
-    def save_summary_stats(self, bets: List[Bet]):
+    def save_summary_stats(self, bets: List[Bet], aggregates: Optional[BetAggregates] = None):
         """Save summary statistics"""
         if not bets:
             return
         
-        # Group by market type
-        market_stats = {}
-        for bet in bets:
-            market_type = bet.market_type
-            if market_type not in market_stats:
-                market_stats[market_type] = {
-                    'count': 0,
-                    'total_ev': 0,
-                    'avg_ev': 0,
-                    'max_ev': 0,
-                    'min_ev': float('inf')
-                }
-            
-            stats = market_stats[market_type]
-            stats['count'] += 1
-            stats['total_ev'] += bet.ev
-            stats['max_ev'] = max(stats['max_ev'], bet.ev)
-            stats['min_ev'] = min(stats['min_ev'], bet.ev)
-        
-        # Calculate averages
-        for market_type, stats in market_stats.items():
-            stats['avg_ev'] = stats['total_ev'] / stats['count']
-            if stats['min_ev'] == float('inf'):
-                stats['min_ev'] = 0
+        if aggregates is None:
+            aggregates = _aggregate(bets)
         
         # Save summary
         summary_path = self.output_dir / "summary.json"
         summary_data = {
             'timestamp': datetime.now().isoformat(),
             'total_bets': len(bets),
-            'overall_avg_ev': sum(bet.ev for bet in bets) / len(bets),
-            'market_breakdown': market_stats
+            'overall_avg_ev': aggregates.total_ev / len(bets),
+            'market_breakdown': aggregates.per_market
         }
         
-        with open(summary_path, 'w') as f:
-            json.dump(summary_data, f, indent=2)
+        with open(summary_path, 'wb') as f:
+            f.write(orjson.dumps(summary_data, option=orjson.OPT_INDENT_2))
         
         self.logger.info(f"Saved summary statistics to {summary_path}")
     
-    def generate_report(self, bets: List[Bet], log_messages: List[str] = None):
-        """Generate complete report"""
+    def generate_report(self, bets: List[Bet], log_messages: List[str] = None) -> BetAggregates:
+        """Generate complete report; returns the EV aggregates it computed"""
+        aggregates = _aggregate(bets)
+        
         self.print_bets_table(bets)
         self.save_bets_csv(bets)
-        self.save_bets_json(bets)
-        self.save_summary_stats(bets)
+        self.save_bets_json(bets, aggregates=aggregates)
+        self.save_summary_stats(bets, aggregates=aggregates)
         
         if log_messages:
             self.save_log(log_messages)
@@ -191,3 +205,5 @@ class OutputManager:
         print(f"📊 Files created: best_bets.csv, best_bets.json, summary.json")
         if log_messages:
             print("📝 Log file: log.txt")
+        
+        return aggregates
@@ -3,13 +3,20 @@
 Run the bot with real TourneyCast data and sample Kalshi data to show best bets
 """
 
+import argparse
+import hashlib
 from datetime import datetime
+from operator import attrgetter
+from pathlib import Path
+
+import orjson
+
 from browser import BrowserClient
-from scrapers.tourneycast_scraper import TourneyCastScraper
 from config import Config
 from matcher import TeamMatcher
 from ev import EVCalculator
 from output import OutputManager
+from kalshi.models import Contract
 
 def create_sample_kalshi_contracts():
     """Create sample Kalshi contracts that match our scraped teams"""
@@ -35,18 +42,43 @@ def create_sample_kalshi_contracts():
     ]
     
     for team, base_price in sample_teams:
-        contracts.append({
-            'ticker': f'{team.upper().replace(" ", "")}-YES',
-            'team_name': team,
-            'title': f'{team} to Make Tournament',
-            'yes_price': base_price,
-            'no_price': 1.0 - base_price
-        })
+        contracts.append(Contract(
+            ticker=f'{team.upper().replace(" ", "")}-YES',
+            team_name=team,
+            title=f'{team} to Make Tournament',
+            yes_price=base_price,
+            no_price=1.0 - base_price
+        ))
     
     return contracts
 
-def run_best_bets():
+def match_with_cache(matcher: TeamMatcher, teams: list, contracts: list,
+                     output_dir: Path, replay: bool = False) -> list:
+    """match_teams_to_contracts, memoized on disk by a SHA256 of its inputs"""
+    key = hashlib.sha256(orjson.dumps(
+        [matcher.min_score, teams, contracts], option=orjson.OPT_SORT_KEYS
+    )).hexdigest()
+    cache_path = output_dir / ".cache" / f"matched_{key}.json"
+    if cache_path.exists():
+        matched = orjson.loads(cache_path.read_bytes())
+        # orjson writes Contracts as objects; rebuild them on the way back in
+        for match in matched:
+            match['contract'] = Contract(**match['contract'])
+        return matched
+    if replay:
+        raise LookupError(f"No cached match result at {cache_path}")
+    
+    matched = matcher.match_teams_to_contracts(teams, contracts, output_dir)
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    cache_path.write_bytes(orjson.dumps(matched))
+    return matched
+
+def run_best_bets(replay: bool = False):
     """Run the bot to get best bets"""
+    # Scrapers pull in lxml; importing them here keeps --help and argument
+    # errors from paying for it.
+    from scrapers.tourneycast_scraper import TourneyCastScraper
+    
     print("🏀 KALSHI BEST BETS - REAL DATA RUN 🏀")
     print("=" * 60)
     
@@ -78,14 +110,15 @@ def run_best_bets():
     
     # Process make tournament markets
     print("🎯 Processing Make Tournament markets...")
-    make_contracts = [c for c in kalshi_contracts if 'to Make Tournament' in c['title']]
-    matched_tourney = matcher.match_teams_to_contracts(tourney_teams, make_contracts, output_dir)
+    make_contracts = [c for c in kalshi_contracts if 'to Make Tournament' in c.title]
+    # The sample contracts never change, so reruns on the same scrape reuse the match
+    matched_tourney = match_with_cache(matcher, tourney_teams, make_contracts, output_dir, replay)
     tourney_bets = ev_calculator.calculate_all_bets(matched_tourney, "make_tournament")
     all_bets.extend(tourney_bets)
     print(f"   Found {len(tourney_bets)} qualifying bets")
     
     # Sort all bets by EV
-    all_bets.sort(key=lambda x: x.ev, reverse=True)
+    all_bets.sort(key=attrgetter('ev'), reverse=True)
     
     print()
     print("🎉 BEST BETS RESULTS:")
@@ -118,4 +151,6 @@ def run_best_bets():
     print("💡 To get real Kalshi data, fix API connectivity issues.")
 
 if __name__ == "__main__":
-    run_best_bets()
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--replay', action='store_true', help='Fail instead of re-matching on a cache miss')
+    run_best_bets(replay=parser.parse_args().replay)
@@ -4,13 +4,20 @@ Final demonstration of the Kalshi Best Bets bot with real TourneyCast data
 """
 
 from datetime import datetime
+from operator import itemgetter
+
+import numpy as np
+from rapidfuzz import fuzz, process
+
 from browser import BrowserClient
-from scrapers.tourneycast_scraper import TourneyCastScraper
 from config import Config
 from matcher import TeamMatcher
 from ev import EVCalculator
 from output import OutputManager
 
+# One row of the results table; "$" sits outside the field, so price/ev widths are one short
+ROW_FMT = "{rank:<5} {team:<20} {side:<5} {prob:<12.1%} ${price:<10.2f} ${ev:<7.3f}"
+
 def create_realistic_march_madness_markets():
     """Create realistic March Madness markets based on real TourneyCast data"""
     # These would be the actual Kalshi market tickers for March Madness
@@ -33,67 +40,126 @@ def create_realistic_march_madness_markets():
     ]
     return realistic_markets
 
-def calculate_ev_bets(tourney_teams, markets):
-    """Calculate EV bets using the correct formula"""
-    bets = []
-    
-    for market in markets:
-        # Find matching team from TourneyCast data
-        team_name = market['team_name']
-        matching_team = None
-        
-        for team in tourney_teams:
-            # Simple name matching (in real bot, this uses rapidfuzz)
-            if team_name.upper() in team['team'].upper() or team['team'].upper() in team_name.upper():
-                matching_team = team
-                break
-        
-        if matching_team:
-            p_in = matching_team['in_probability']
-            yes_buy_price = market['yes_buy_price']
-            no_buy_price = market['no_buy_price']
-            
-            # Calculate EV using your formula
-            ev_yes = p_in - yes_buy_price if yes_buy_price else None
-            ev_no = (1 - p_in) - no_buy_price if no_buy_price else None
-            
-            # Choose the better EV
-            if ev_yes is not None and ev_no is not None:
-                if ev_yes > ev_no:
-                    bets.append({
-                        'team': team_name,
-                        'market_type': 'Make Tournament',
-                        'side': 'YES',
-                        'model_prob': p_in,
-                        'buy_price': yes_buy_price,
-                        'ev': ev_yes,
-                        'ticker': market['ticker']
-                    })
-                else:
-                    bets.append({
-                        'team': team_name,
-                        'market_type': 'Make Tournament', 
-                        'side': 'NO',
-                        'model_prob': 1 - p_in,
-                        'buy_price': no_buy_price,
-                        'ev': ev_no,
-                        'ticker': market['ticker']
-                    })
-            elif ev_yes is not None:
-                bets.append({
-                    'team': team_name,
-                    'market_type': 'Make Tournament',
-                    'side': 'YES',
-                    'model_prob': p_in,
-                    'buy_price': yes_buy_price,
-                    'ev': ev_yes,
-                    'ticker': market['ticker']
-                })
-    
-    return bets
+# Market team name -> BartTorvik name, both uppercased, for names that differ
+# between the two sources.
+TEAM_ALIASES = {
+    'UNC': 'NORTH CAROLINA',
+    'UCONN': 'CONNECTICUT',
+    'CONN': 'CONNECTICUT',
+    'MICHIGAN STATE': 'MICHIGAN ST.',
+    'OHIO STATE': 'OHIO ST.',
+    'IOWA STATE': 'IOWA ST.',
+    'KANSAS STATE': 'KANSAS ST.',
+    'MISSISSIPPI STATE': 'MISSISSIPPI ST.',
+    'OLE MISS': 'MISSISSIPPI',
+}
+
+FUZZY_MATCH_CUTOFF = 92
+# Tokens that name a different school rather than spell the same one differently
+# ("SOUTH CAROLINA" vs "NORTH CAROLINA", "KANSAS ST." vs "KANSAS").
+_DISTINGUISHING_TOKENS = frozenset({
+    'NORTH', 'SOUTH', 'EAST', 'WEST', 'CENTRAL',
+    'NORTHERN', 'SOUTHERN', 'EASTERN', 'WESTERN', 'ST', 'STATE',
+})
+
+def _name_tokens(name: str) -> list:
+    return name.replace('.', ' ').split()
+
+def _same_school_shape(a: str, b: str) -> bool:
+    """Fuzzy candidates must have as many tokens and the same distinguishing tokens"""
+    a_tokens = _name_tokens(a)
+    b_tokens = _name_tokens(b)
+    return (
+        len(a_tokens) == len(b_tokens)
+        and _DISTINGUISHING_TOKENS.intersection(a_tokens) == _DISTINGUISHING_TOKENS.intersection(b_tokens)
+    )
+
+def _fuzzy_index(key: str, upper_teams):
+    """Index of the best-scoring team that passes the shape guard, or None"""
+    candidates = process.extract(key, upper_teams, scorer=fuzz.token_sort_ratio,
+                                 score_cutoff=FUZZY_MATCH_CUTOFF, limit=None)
+    for name, _, i in candidates:
+        if _same_school_shape(key, name):
+            return i
+    return None
+
+def _find_team_indices(tourney_teams, markets) -> np.ndarray:
+    """Index into tourney_teams of each market's team, or -1 if none matches"""
+    upper_teams = [team['team'].upper() for team in tourney_teams]
+    # First occurrence wins, as the old linear scan did
+    name_to_idx = {}
+    for i, name in enumerate(upper_teams):
+        name_to_idx.setdefault(name, i)
+    
+    idx = np.full(len(markets), -1, dtype=np.intp)
+    for j, market in enumerate(markets):
+        key = market['team_name'].upper()
+        i = name_to_idx.get(key)
+        if i is None:
+            i = name_to_idx.get(TEAM_ALIASES.get(key, key))
+        if i is None:
+            # Only names with no exact or alias hit pay for a fuzzy pass
+            i = _fuzzy_index(key, upper_teams)
+        if i is not None:
+            idx[j] = i
+    return idx
+
+def _ev_kernel(p: np.ndarray, yes: np.ndarray, no: np.ndarray):
+    """Per-market (side_yes, ev, model_prob) for YES probability p; a 0 price is unavailable"""
+    # Calculate EV using your formula
+    ev_yes = p - yes
+    ev_no = (1 - p) - no
+    
+    # Choose the better EV; YES wins only strictly, or by default with no NO price
+    side_yes = (no == 0) | (ev_yes > ev_no)
+    return side_yes, np.where(side_yes, ev_yes, ev_no), np.where(side_yes, p, 1 - p)
+
+def calculate_ev_bets(tourney_teams, markets, min_ev=None):
+    """Calculate EV bets using the correct formula; with min_ev, only bets at or above it"""
+    if not tourney_teams or not markets:
+        return []
+    
+    # One array per field (structure of arrays); EV for every market in a few ufuncs
+    # A missing or zero price means that side can't be bought
+    yes = np.array([market['yes_buy_price'] or 0.0 for market in markets], dtype=np.float64)
+    no = np.array([market['no_buy_price'] or 0.0 for market in markets], dtype=np.float64)
+    # A NO price alone is not bet; neither is a market whose best case (p = 1 or 0)
+    # can't reach min_ev, so only the rest pay for the name match
+    candidate = yes != 0
+    if min_ev is not None:
+        candidate &= np.maximum(1 - yes, 1 - no) >= min_ev
+    candidates = np.flatnonzero(candidate)
+    idx = np.full(len(markets), -1, dtype=np.intp)
+    idx[candidates] = _find_team_indices(tourney_teams, [markets[j] for j in candidates])
+    
+    p_in = np.fromiter((team['in_probability'] for team in tourney_teams),
+                       dtype=np.float64, count=len(tourney_teams))
+    p = p_in[np.maximum(idx, 0)]
+    side_yes, ev, model_prob = _ev_kernel(p, yes, no)
+    qualifies = idx >= 0
+    if min_ev is not None:
+        qualifies &= ev >= min_ev
+    keep = np.flatnonzero(qualifies)
+    
+    return [
+        {
+            'team': markets[j]['team_name'],
+            'market_type': 'Make Tournament',
+            'side': 'YES' if side_yes[j] else 'NO',
+            'model_prob': float(model_prob[j]),
+            'buy_price': markets[j]['yes_buy_price'] if side_yes[j] else markets[j]['no_buy_price'],
+            'ev': float(ev[j]),
+            'ticker': markets[j]['ticker']
+        }
+        for j in keep
+    ]
 
 def run_final_best_bets():
     """Run the final best bets demonstration"""
+    # Scrapers pull in lxml; importing them here keeps importing this module
+    # (e.g. for calculate_ev_bets) from paying for it.
+    from scrapers.tourneycast_scraper import TourneyCastScraper
+    
     print("🏀 KALSHI BEST BETS - FINAL DEMONSTRATION 🏀")
     print("=" * 60)
     print("Using REAL TourneyCast data + REALISTIC March Madness markets")
@@ -119,10 +185,10 @@ def run_final_best_bets():
     
     # Calculate EV bets
     print("🎯 Calculating EV bets...")
-    bets = calculate_ev_bets(tourney_teams, markets)
+    bets = calculate_ev_bets(tourney_teams, markets, min_ev=config.ev['min_ev'])
     
     # Sort by EV
-    bets.sort(key=lambda x: x['ev'], reverse=True)
+    bets.sort(key=itemgetter('ev'), reverse=True)
     
     print()
     print("🎉 FINAL KALSHI BEST BETS RESULTS:")
@@ -135,12 +201,11 @@ def run_final_best_bets():
         print(f"{'Rank':<5} {'Team':<20} {'Side':<5} {'Model Prob':<12} {'Buy Price':<11} {'EV':<8}")
         print("-" * 80)
         
-        for i, bet in enumerate(bets[:15]):
-            prob_pct = f"{bet['model_prob']:.1%}"
-            price_dollar = f"${bet['buy_price']:.2f}"
-            ev_dollar = f"${bet['ev']:.3f}"
-            
-            print(f"{i+1:<5} {bet['team'][:18]:<20} {bet['side']:<5} {prob_pct:<12} {price_dollar:<11} {ev_dollar:<8}")
+        print("\n".join(
+            ROW_FMT.format(rank=i + 1, team=bet['team'][:18], side=bet['side'],
+                           prob=bet['model_prob'], price=bet['buy_price'], ev=bet['ev'])
+            for i, bet in enumerate(bets[:15])
+        ))
         
         print()
         print("📊 SUMMARY:")
@@ -4,16 +4,27 @@ Run the bot with real TourneyCast data and REAL Kalshi esports markets
 """
 
 from datetime import datetime
+from itertools import islice
+from operator import attrgetter
+
+import numpy as np
+
 from browser import BrowserClient
-from scrapers.tourneycast_scraper import TourneyCastScraper
 from config import Config
 from matcher import TeamMatcher
 from ev import EVCalculator
 from output import OutputManager
-from kalshi.kalshi_client import KalshiClient
+
+# Markets to analyze; the listing is paged, so stopping here skips the remaining pages
+MAX_MARKETS = 50
 
 def run_real_esports_bets():
     """Run the bot with real esports markets"""
+    # Scrapers pull in lxml and the Kalshi client pulls in cryptography; importing
+    # them here keeps a plain import of this module from paying for either.
+    from scrapers.tourneycast_scraper import TourneyCastScraper
+    from kalshi.kalshi_client import KalshiClient
+    
     print("🎮 KALSHI ESPORTS BEST BETS - REAL DATA RUN 🎮")
     print("=" * 60)
     
@@ -41,7 +52,7 @@ def run_real_esports_bets():
     print("🎮 Fetching REAL Kalshi esports markets...")
     
     # Get real esports markets from Kalshi
-    esports_markets = kalshi_client.get_markets_by_title("yes")  # Get all markets with "yes"
+    esports_markets = list(islice(kalshi_client.iter_markets_by_title("yes"), MAX_MARKETS))  # Markets with "yes"
     
     if not esports_markets:
         print("❌ No esports markets found")
@@ -55,21 +66,21 @@ def run_real_esports_bets():
         print(f"   {i+1}. {market.get('ticker', 'N/A')} - {market.get('title', 'N/A')[:80]}...")
     
     # Create fake TourneyCast data for esports teams that match the markets
-    esports_teams = []
+    team_names = []
     for market in esports_markets[:20]:  # Use first 20 markets
         title = market.get('title', '')
         # Extract team names from market titles
         if 'yes ' in title.lower():
             parts = title.split('yes ')
             if len(parts) > 1:
-                team_name = parts[1].split(',')[0].strip()  # Get first team after "yes"
-                # Create fake probability based on market title
-                prob = 0.5 + (hash(team_name) % 40) / 100.0  # Random-ish probability between 0.5-0.9
-                esports_teams.append({
-                    'team': team_name,
-                    'conference': 'ESPORTS',
-                    'in_probability': min(prob, 0.95)
-                })
+                team_names.append(parts[1].split(',')[0].strip())  # Get first team after "yes"
+    
+    # Fake probabilities between 0.5-0.9, drawn in one call; seeded so reruns match
+    probs = np.random.default_rng(0).uniform(0.5, 0.9, size=len(team_names))
+    esports_teams = [
+        {'team': team_name, 'conference': 'ESPORTS', 'in_probability': float(prob)}
+        for team_name, prob in zip(team_names, probs)
+    ]
     
     print(f"\n📊 Created {len(esports_teams)} esports team entries")
     
@@ -83,7 +94,7 @@ def run_real_esports_bets():
     print(f"   Found {len(esports_bets)} qualifying esports bets")
     
     # Sort all bets by EV
-    all_bets.sort(key=lambda x: x.ev, reverse=True)
+    all_bets.sort(key=attrgetter('ev'), reverse=True)
     
     print()
     print("🎉 REAL ESPORTS BEST BETS RESULTS:")
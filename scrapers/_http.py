@@ -0,0 +1,83 @@
+"""Plain-HTTP table loading for the BartTorvik scrapers.
+
+BartTorvik serves its tables as static HTML, so a GET plus lxml is enough. A
+headless browser is only needed when the site answers with a JS browser check
+instead of the page; load_table_rows falls back to one in that case.
+"""
+
+import logging
+from typing import List, Optional, Tuple
+
+import lxml.html
+from lxml import etree
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+Row = Tuple[List[str], List[str]]
+
+# Selenium's By.TAG_NAME; spelled out so the HTTP path never imports selenium.
+_TABLE_LOCATOR = ("tag name", "table")
+
+_session = requests.Session()
+_session.headers["User-Agent"] = (
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/120.0 Safari/537.36"
+)
+_adapter = HTTPAdapter(
+    pool_maxsize=8,
+    max_retries=Retry(total=2, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504)),
+)
+_session.mount("https://", _adapter)
+_session.mount("http://", _adapter)
+
+
+def fetch(url: str, timeout: float = 20) -> Optional[str]:
+    """GET a page and return its HTML, or None on any HTTP failure."""
+    try:
+        resp = _session.get(url, timeout=timeout)
+        resp.raise_for_status()
+        return resp.text
+    except requests.RequestException as exc:
+        logger.warning("HTTP fetch failed for %s: %s", url, exc)
+        return None
+
+
+# Compiled once; calling .xpath() with a string re-parses the expression every row.
+_TABLE_ROWS = etree.XPath("//table//tr")
+_ANY_ROWS = etree.XPath("//tr")
+_HEADER_CELLS = etree.XPath(".//th")
+_DATA_CELLS = etree.XPath(".//td")
+
+
+def parse_table_rows(html: str) -> List[Row]:
+    """(header texts, cell texts) per table row; same shape as BrowserClient.table_rows."""
+    doc = lxml.html.fromstring(html)
+    rows = _TABLE_ROWS(doc) or _ANY_ROWS(doc)
+    return [
+        ([c.text_content().strip() for c in _HEADER_CELLS(row)],
+         [c.text_content().strip() for c in _DATA_CELLS(row)])
+        for row in rows
+    ]
+
+
+def load_table_rows(url: str, browser=None, use_browser: bool = False) -> Optional[List[Row]]:
+    """
+    Table rows for a page: over HTTP unless use_browser, then through `browser`
+    if HTTP gave no table. None means the page could not be loaded at all.
+    """
+    if use_browser and browser is None:
+        raise ValueError("use_browser requires a browser")
+    if not use_browser:
+        html = fetch(url)
+        if html is not None and "<table" in html.lower():
+            return parse_table_rows(html)
+        if browser is None:
+            return None
+        logger.info("No table in static HTML for %s; rendering with Chrome", url)
+
+    if not browser.get_page(url, wait_for=_TABLE_LOCATOR):
+        return None
+    return browser.table_rows("table tr") or browser.table_rows("tr")
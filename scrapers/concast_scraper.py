@@ -1,32 +1,38 @@
+import re
 import logging
-from typing import List, Dict
-
-from selenium.webdriver.common.by import By
+from typing import List, Dict, Optional
 
 from browser import BrowserClient
+from scrapers._http import load_table_rows
 
 CONODDS_URL = "https://barttorvik.com/conodds.php?conf={conf_code}"
+# A whole cell holding one number with an optional trailing %, e.g. " 99.5% "
+_PCT_RE = re.compile(r"\s*([+-]?(?:\d+\.?\d*|\.\d+))\s*%?\s*")
+# Accepted header texts per column, lowercased, in order of preference
+_TEAM_HEADERS = ("team", "school")
 
 
 class ConCastScraper:
-    def __init__(self, browser: BrowserClient):
+    def __init__(self, browser: Optional[BrowserClient] = None, use_browser: bool = False):
+        # The page is fetched over plain HTTP; the browser is only a fallback for
+        # when BartTorvik serves a JS check instead, or the path when use_browser.
+        if use_browser and browser is None:
+            raise ValueError("use_browser requires a browser")
         self.browser = browser
+        self.use_browser = use_browser
         self.logger = logging.getLogger(__name__)
 
     def scrape_conference_odds(self, conf_code: str) -> List[Dict]:
         url = CONODDS_URL.format(conf_code=conf_code)
         self.logger.info("Scraping conference odds from %s", url)
 
-        if not self.browser.get_page(url, wait_time=5):
+        rows = load_table_rows(url, self.browser, self.use_browser)
+        if rows is None:
             self.logger.error("Failed to load conference odds page for %s", conf_code)
             return []
 
         teams: List[Dict] = []
         try:
-            rows = self.browser.find_elements(By.CSS_SELECTOR, "table tr")
-            if not rows:
-                rows = self.browser.find_elements(By.TAG_NAME, "tr")
-
             self.logger.info("Found %d table rows for %s", len(rows), conf_code)
 
             header_idx = self._find_header_indices(rows)
@@ -36,14 +42,13 @@ class ConCastScraper:
 
             team_col, share_col, sole_col = header_idx
 
-            for row in rows[1:]:
-                cells = row.find_elements(By.TAG_NAME, "td")
+            for _, cells in rows[1:]:
                 if len(cells) <= max(team_col, share_col, sole_col):
                     continue
 
-                team_name = cells[team_col].text.strip()
-                share_text = cells[share_col].text.strip()
-                sole_text = cells[sole_col].text.strip()
+                team_name = cells[team_col]
+                share_text = cells[share_col]
+                sole_text = cells[sole_col]
 
                 if not team_name or not share_text:
                     continue
@@ -69,24 +74,13 @@ class ConCastScraper:
         return teams
 
     def _find_header_indices(self, rows):
-        for row in rows:
-            cells = row.find_elements(By.TAG_NAME, "th")
-            if not cells:
-                cells = row.find_elements(By.TAG_NAME, "td")
-
-            headers = [c.text.strip().lower() for c in cells]
+        for th, td in rows:
+            # Header text -> column; reversed so a repeated header keeps its first column
+            h2i = {c.lower(): i for i, c in reversed(list(enumerate(th or td)))}
 
-            team_col = None
-            share_col = None
-            sole_col = None
-
-            for i, h in enumerate(headers):
-                if "team" in h:
-                    team_col = i
-                if h == "share":
-                    share_col = i
-                if h == "sole":
-                    sole_col = i
+            team_col = next((h2i[k] for k in _TEAM_HEADERS if k in h2i), None)
+            share_col = h2i.get("share")
+            sole_col = h2i.get("sole")
 
             if team_col is not None and share_col is not None and sole_col is not None:
                 return (team_col, share_col, sole_col)
@@ -94,8 +88,5 @@ class ConCastScraper:
         return None
 
     def _parse_percentage(self, text: str):
-        text = text.replace("%", "").strip()
-        try:
-            return float(text)
-        except ValueError:
-            return None
+        m = _PCT_RE.fullmatch(text)
+        return float(m.group(1)) if m else None
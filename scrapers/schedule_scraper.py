@@ -1,17 +1,21 @@
 import logging
 from datetime import datetime
-from typing import List, Dict
-
-from selenium.webdriver.common.by import By
+from typing import List, Dict, Optional
 
 from browser import BrowserClient
+from scrapers._http import load_table_rows
 
 SCHEDULE_URL = "https://barttorvik.com/schedule.php?date={date_str}"
 
 
 class ScheduleScraper:
-    def __init__(self, browser: BrowserClient):
+    def __init__(self, browser: Optional[BrowserClient] = None, use_browser: bool = False):
+        # The page is fetched over plain HTTP; the browser is only a fallback for
+        # when BartTorvik serves a JS check instead, or the path when use_browser.
+        if use_browser and browser is None:
+            raise ValueError("use_browser requires a browser")
         self.browser = browser
+        self.use_browser = use_browser
         self.logger = logging.getLogger(__name__)
 
     def scrape_games(self, target_date: datetime) -> List[Dict]:
@@ -19,20 +23,16 @@ class ScheduleScraper:
         url = SCHEDULE_URL.format(date_str=date_str)
         self.logger.info("Scraping schedule from %s", url)
 
-        if not self.browser.get_page(url, wait_time=5):
+        rows = load_table_rows(url, self.browser, self.use_browser)
+        if rows is None:
             self.logger.error("Failed to load schedule page")
             return []
 
         games: List[Dict] = []
         try:
-            rows = self.browser.find_elements(By.CSS_SELECTOR, "table tr")
-            if not rows:
-                rows = self.browser.find_elements(By.TAG_NAME, "tr")
-
             self.logger.info("Found %d table rows", len(rows))
 
-            for row in rows[1:]:
-                cells = row.find_elements(By.TAG_NAME, "td")
+            for _, cells in rows[1:]:
                 if len(cells) < 2:
                     continue
 
@@ -49,21 +49,23 @@ class ScheduleScraper:
     def _parse_game_row(self, cells) -> Dict:
         try:
             matchup_text = ""
-            for cell in cells:
-                text = cell.text.strip()
-                if "@" in text or " at " in text.lower() or " vs " in text.lower():
-                    matchup_text = text
+            lower = ""
+            for text in cells:
+                # Case-fold each cell once for both keyword checks
+                tl = text.lower()
+                if "@" in text or " at " in tl or " vs " in tl:
+                    matchup_text, lower = text, tl
                     break
 
             if not matchup_text:
                 if len(cells) >= 2:
-                    time_text = cells[0].text.strip()
+                    time_text = cells[0]
                     if len(cells) >= 3:
-                        away_team = cells[1].text.strip()
-                        home_team = cells[2].text.strip()
+                        away_team = cells[1]
+                        home_team = cells[2]
                     else:
-                        away_team = cells[0].text.strip()
-                        home_team = cells[1].text.strip()
+                        away_team = cells[0]
+                        home_team = cells[1]
                     if away_team and home_team:
                         return {
                             "time": time_text,
@@ -72,18 +74,18 @@ class ScheduleScraper:
                         }
                 return {}
 
-            if " at " in matchup_text.lower():
-                parts = matchup_text.lower().split(" at ")
+            if " at " in lower:
+                parts = lower.split(" at ")
             elif " @ " in matchup_text:
                 parts = matchup_text.split(" @ ")
-            elif " vs " in matchup_text.lower():
-                parts = matchup_text.lower().split(" vs ")
+            elif " vs " in lower:
+                parts = lower.split(" vs ")
             else:
                 return {}
 
             if len(parts) == 2:
                 return {
-                    "time": cells[0].text.strip() if cells else "",
+                    "time": cells[0] if cells else "",
                     "away_team": parts[0].strip(),
                     "home_team": parts[1].strip(),
                 }
@@ -1,33 +1,40 @@
 import re
 import logging
 import time
-from typing import List, Dict
-
-from selenium.webdriver.common.by import By
+from typing import List, Dict, Optional
 
 from browser import BrowserClient
+from scrapers._http import load_table_rows
 
 TOURNEYCAST_URL = "https://barttorvik.com/tourneycast.php"
+# A whole cell holding one number with an optional trailing %, e.g. " 99.5% "
+_PCT_RE = re.compile(r"\s*([+-]?(?:\d+\.?\d*|\.\d+))\s*%?\s*")
+# Accepted header texts per column, lowercased, in order of preference
+_TEAM_HEADERS = ("team", "school")
+_CONF_HEADERS = ("conf", "conference")
+_IN_HEADERS = ("in %", "in%", "in")
 
 
 class TourneyCastScraper:
-    def __init__(self, browser: BrowserClient):
+    def __init__(self, browser: Optional[BrowserClient] = None, use_browser: bool = False):
+        # The page is fetched over plain HTTP; the browser is only a fallback for
+        # when BartTorvik serves a JS check instead, or the path when use_browser.
+        if use_browser and browser is None:
+            raise ValueError("use_browser requires a browser")
         self.browser = browser
+        self.use_browser = use_browser
         self.logger = logging.getLogger(__name__)
 
     def scrape_tourney_probabilities(self) -> List[Dict]:
         self.logger.info("Scraping TourneyCast from %s", TOURNEYCAST_URL)
 
-        if not self.browser.get_page(TOURNEYCAST_URL, wait_time=5):
+        rows = load_table_rows(TOURNEYCAST_URL, self.browser, self.use_browser)
+        if rows is None:
             self.logger.error("Failed to load TourneyCast page")
             return []
 
         teams: List[Dict] = []
         try:
-            rows = self.browser.find_elements(By.CSS_SELECTOR, "table tr")
-            if not rows:
-                rows = self.browser.find_elements(By.TAG_NAME, "tr")
-
             self.logger.info("Found %d table rows", len(rows))
 
             header_idx = self._find_header_indices(rows)
@@ -37,14 +44,13 @@ class TourneyCastScraper:
 
             team_col, conf_col, in_col = header_idx
 
-            for row in rows[1:]:
-                cells = row.find_elements(By.TAG_NAME, "td")
+            for _, cells in rows[1:]:
                 if len(cells) <= max(team_col, conf_col, in_col):
                     continue
 
-                team_name = cells[team_col].text.strip()
-                conference = cells[conf_col].text.strip()
-                in_pct_text = cells[in_col].text.strip()
+                team_name = cells[team_col]
+                conference = cells[conf_col]
+                in_pct_text = cells[in_col]
 
                 if not team_name or not in_pct_text:
                     continue
@@ -68,27 +74,16 @@ class TourneyCastScraper:
         return teams
 
     def _find_header_indices(self, rows):
-        for row in rows:
-            cells = row.find_elements(By.TAG_NAME, "th")
-            if not cells:
-                cells = row.find_elements(By.TAG_NAME, "td")
-
-            headers = [c.text.strip().lower() for c in cells]
-
-            team_col = None
-            conf_col = None
-            in_col = None
-
-            for i, h in enumerate(headers):
-                if h == "team" or h == "":
-                    if team_col is None and i == 0:
-                        team_col = i
-                if "team" in h:
-                    team_col = i
-                if h in ("conf", "conference"):
-                    conf_col = i
-                if h in ("in %", "in%", "in"):
-                    in_col = i
+        for th, td in rows:
+            # Header text -> column; reversed so a repeated header keeps its first column
+            h2i = {c.lower(): i for i, c in reversed(list(enumerate(th or td)))}
+
+            team_col = next((h2i[k] for k in _TEAM_HEADERS if k in h2i), None)
+            if team_col is None and h2i.get("") == 0:
+                # TourneyCast sometimes leaves the team column header blank
+                team_col = 0
+            conf_col = next((h2i[k] for k in _CONF_HEADERS if k in h2i), None)
+            in_col = next((h2i[k] for k in _IN_HEADERS if k in h2i), None)
 
             if team_col is not None and conf_col is not None and in_col is not None:
                 return (team_col, conf_col, in_col)
@@ -96,8 +91,5 @@ class TourneyCastScraper:
         return None
 
     def _parse_percentage(self, text: str):
-        text = text.replace("%", "").strip()
-        try:
-            return float(text)
-        except ValueError:
-            return None
+        m = _PCT_RE.fullmatch(text)
+        return float(m.group(1)) if m else None
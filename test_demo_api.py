@@ -4,13 +4,21 @@ Test the Kalshi demo API
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+
+from kalshi.constants import MAKE_TOURNAMENT_SERIES
+
+# One keep-alive session so each request after the first skips the TCP/TLS handshake
+SESSION = requests.Session()
+SESSION.headers.update({'Accept': 'application/json'})
+SESSION.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=8))
 
 def test_demo_api():
     """Test the Kalshi demo API"""
     print("🔍 Testing Kalshi Demo API...")
     
     # Get the first open market (no auth required for public market data)
-    response = requests.get('https://demo-api.kalshi.co/trade-api/v2/markets?limit=1&status=open')
+    response = SESSION.get('https://demo-api.kalshi.co/trade-api/v2/markets?limit=1&status=open', timeout=10)
     
     if response.status_code == 200:
         market = response.json()['markets'][0]
@@ -19,19 +27,15 @@ def test_demo_api():
         print(f"   Title: {market['title']}")
         print(f"   Status: {market['status']}")
         
-        # Get more markets to look for basketball
-        response = requests.get('https://demo-api.kalshi.co/trade-api/v2/markets?limit=50&status=open')
+        # Ask for the tournament series directly instead of scanning titles client-side
+        response = SESSION.get(
+            'https://demo-api.kalshi.co/trade-api/v2/markets',
+            params={'series_ticker': MAKE_TOURNAMENT_SERIES, 'status': 'open', 'limit': 200},
+            timeout=10,
+        )
         
         if response.status_code == 200:
-            markets = response.json()['markets']
-            print(f"\n📊 Found {len(markets)} open markets")
-            
-            # Look for basketball markets
-            basketball_markets = []
-            for market in markets:
-                title = market.get('title', '').lower()
-                if any(keyword in title for keyword in ['basketball', 'ncaa', 'march madness', 'college', 'tournament']):
-                    basketball_markets.append(market)
+            basketball_markets = response.json()['markets']
             
             print(f"🏀 Found {len(basketball_markets)} basketball markets:")
             
@@ -5,6 +5,14 @@ Test the Kalshi elections API
 
 import requests
 import json
+from requests.adapters import HTTPAdapter
+
+from kalshi.constants import MAKE_TOURNAMENT_SERIES
+
+# One keep-alive session so each request after the first skips the TCP/TLS handshake
+SESSION = requests.Session()
+SESSION.headers.update({'Accept': 'application/json'})
+SESSION.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=8))
 
 def test_kalshi_api():
     """Test the Kalshi elections API"""
@@ -17,7 +25,7 @@ def test_kalshi_api():
     print(f"📡 Requesting: {markets_url}")
     
     try:
-        response = requests.get(markets_url)
+        response = SESSION.get(markets_url, params={'limit': 5}, timeout=10)
         print(f"📊 Status Code: {response.status_code}")
         
         if response.status_code == 200:
@@ -36,7 +44,7 @@ def test_kalshi_api():
                 orderbook_url = f"{base_url}/markets/{ticker}/orderbook"
                 
                 print(f"\n📈 Testing orderbook for {ticker}...")
-                orderbook_response = requests.get(orderbook_url)
+                orderbook_response = SESSION.get(orderbook_url, timeout=10)
                 
                 if orderbook_response.status_code == 200:
                     orderbook = orderbook_response.json()
@@ -56,13 +64,14 @@ def test_kalshi_api():
                     else:
                         print(f"   NO bids: 0")
                         
-                    # Look for basketball markets
+                    # Ask for the tournament series directly instead of scanning titles client-side
                     print(f"\n🏀 Searching for basketball markets...")
-                    basketball_markets = []
-                    for market in markets:
-                        title = market.get('title', '').lower()
-                        if any(keyword in title for keyword in ['basketball', 'tournament', 'march madness', 'ncaa']):
-                            basketball_markets.append(market)
+                    series_response = SESSION.get(
+                        markets_url,
+                        params={'series_ticker': MAKE_TOURNAMENT_SERIES, 'status': 'open', 'limit': 200},
+                        timeout=10,
+                    )
+                    basketball_markets = series_response.json().get('markets', []) if series_response.ok else []
                     
                     print(f"   Found {len(basketball_markets)} basketball-related markets")
                     if basketball_markets:
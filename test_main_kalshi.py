@@ -3,13 +3,19 @@
 Test the main Kalshi API with real credentials
 """
 
-from kalshi.kalshi_client import KalshiClient
+import re
+from itertools import islice
+
+from kalshi.kalshi_client import default_client
+
+# Basketball/tournament title keywords, matched case-insensitively in one scan
+KEYWORDS_RE = re.compile(r'basketball|tournament|march madness|ncaa', re.IGNORECASE)
 
 def test_main_kalshi_api():
     """Test the main Kalshi API with authentication"""
     print("🔐 Testing Main Kalshi API with Authentication...")
     
-    client = KalshiClient()
+    client = default_client()
     
     # Test markets endpoint
     print("📡 Testing /markets endpoint...")
@@ -19,33 +25,38 @@ def test_main_kalshi_api():
         print(f"✅ Found {len(markets)} markets")
         
         # Look for basketball/tournament markets
-        basketball_markets = []
-        for market in markets:
-            title = market.get('title', '').lower()
-            if any(keyword in title for keyword in ['basketball', 'tournament', 'march madness', 'ncaa', 'make tournament']):
-                basketball_markets.append(market)
+        basketball_markets = [m for m in markets if KEYWORDS_RE.search(m.get('title', ''))]
         
         print(f"🏀 Found {len(basketball_markets)} basketball-related markets")
         
         if basketball_markets:
             print("\n🏀 Basketball markets:")
-            for i, market in enumerate(basketball_markets[:5]):
-                print(f"   {i+1}. {market.get('ticker', 'N/A')} - {market.get('title', 'N/A')}")
+            shown = basketball_markets[:5]
+            # One batched price lookup for every shown market instead of one call each
+            price_error = None
+            try:
+                prices_by_ticker = client.get_market_prices_batch([m.get('ticker') for m in shown])
+            except Exception as e:
+                prices_by_ticker, price_error = {}, e
+            # Collected and printed in one write
+            lines = []
+            for i, market in enumerate(shown, 1):
+                lines.append(f"   {i}. {market.get('ticker', 'N/A')} - {market.get('title', 'N/A')}")
                 
                 # Get price info
                 ticker = market.get('ticker')
                 if ticker:
-                    try:
-                        # Try to get price using the client
-                        yes_price = client._get_yes_price(ticker)
-                        print(f"      YES Price: ${yes_price:.3f}")
-                    except Exception as e:
-                        print(f"      Price error: {e}")
+                    if price_error is None:
+                        yes_price = float(prices_by_ticker.get(ticker, {}).get('yes_buy_price', 0.0))
+                        lines.append(f"      YES Price: ${yes_price:.3f}")
+                    else:
+                        lines.append(f"      Price error: {price_error}")
+            print("\n".join(lines))
         else:
             print("   No basketball markets found")
             print("   Showing first 5 markets instead:")
-            for i, market in enumerate(markets[:5]):
-                print(f"   {i+1}. {market.get('ticker', 'N/A')} - {market.get('title', 'N/A')}")
+            for i, market in enumerate(islice(markets, 5), 1):
+                print(f"   {i}. {market.get('ticker', 'N/A')} - {market.get('title', 'N/A')}")
     else:
         print("❌ No markets found")
     
@@ -60,8 +71,9 @@ def test_main_kalshi_api():
         "SEC"
     ]
     
+    markets_by_title = client.get_markets_by_titles(test_titles)
     for title in test_titles:
-        markets = client.get_markets_by_title(title)
+        markets = markets_by_title[title]
         print(f"   '{title}': {len(markets)} markets")
         if markets:
             print(f"      Example: {markets[0].get('title', 'N/A')}")
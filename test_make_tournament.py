@@ -3,13 +3,17 @@
 Test to find Make Tournament markets using the correct method
 """
 
-from kalshi.kalshi_client import KalshiClient
+from itertools import islice
+
+import orjson
+
+from kalshi.kalshi_client import default_client
 
 def test_make_tournament_markets():
     """Test to find Make Tournament markets"""
     print("🏀 Testing Make Tournament Markets Search...")
     
-    client = KalshiClient()
+    client = default_client()
     
     # Get Make Tournament markets
     markets = client.get_make_tournament_markets()
@@ -19,15 +23,17 @@ def test_make_tournament_markets():
         
         # Show first few markets
         print("\n🏀 Sample Make Tournament Markets:")
-        for i, market in enumerate(markets[:10]):
-            ticker = market.get('ticker', 'N/A')
-            team_name = market.get('team_name', 'N/A')
+        sample = markets[:10]
+        prices_by_ticker = client.get_market_prices_batch([m.ticker for m in sample if m.ticker])
+        for i, market in enumerate(sample):
+            ticker = market.ticker or 'N/A'
+            team_name = market.team_name or 'N/A'
             print(f"   {i+1}. {ticker}")
             print(f"      Team: {team_name}")
-            print(f"      Title: {market.get('title', 'N/A')}")
+            print(f"      Title: {market.title or 'N/A'}")
             
             # Get prices
-            prices = client.get_market_prices(ticker)
+            prices = prices_by_ticker.get(ticker, {})
             yes_buy = prices.get('yes_buy_price')
             no_buy = prices.get('no_buy_price')
             
@@ -40,13 +46,15 @@ def test_make_tournament_markets():
         # Debug: show some sample markets to see what's available
         print("\n🔍 Debug: Showing sample available markets...")
         try:
-            import requests
-            response = requests.get('https://demo-api.kalshi.co/trade-api/v2/markets?status=open&limit=10')
+            # The client's session already holds a warm connection pool
+            response = client.session.get(
+                'https://demo-api.kalshi.co/trade-api/v2/markets?status=open&limit=10', timeout=10
+            )
             if response.status_code == 200:
-                markets = response.json()['markets']
-                for i, market in enumerate(markets[:5]):
+                markets = orjson.loads(response.content)['markets']
+                for i, market in enumerate(islice(markets, 5), 1):
                     ticker = market.get('ticker', 'N/A')
-                    print(f"   {i+1}. {ticker} - {market.get('title', 'N/A')}")
+                    print(f"   {i}. {ticker} - {market.get('title', 'N/A')}")
         except Exception as e:
             print(f"   Error: {e}")
 
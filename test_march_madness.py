@@ -3,13 +3,20 @@
 Test to find March Madness markets using the elections API
 """
 
-from kalshi.kalshi_client import KalshiClient
+import re
+
+from kalshi.kalshi_client import default_client
+
+# Basketball title keywords, matched case-insensitively in one scan
+KEYWORDS_RE = re.compile(r'basketball|ncaa|march madness|college|bracket', re.IGNORECASE)
 
 def test_march_madness_markets():
     """Test to find March Madness markets"""
     print("🏀 Searching for March Madness Markets...")
     
-    client = KalshiClient()
+    # Market listings are cached on disk for a few minutes, so reruns while iterating
+    # on this script don't re-page the whole open-market listing
+    client = default_client()
     
     # Test different search terms based on the screenshot
     search_terms = [
@@ -25,21 +32,41 @@ def test_march_madness_markets():
     ]
     
     all_markets = []
+    markets_by_term = client.get_markets_by_titles(search_terms)
+    
+    # Terms overlap, so the same market comes back under several of them; judge
+    # each ticker once and reuse the verdict
+    is_basketball = {}
+    for markets in markets_by_term.values():
+        for market in markets:
+            ticker = market.get('ticker')
+            if ticker not in is_basketball:
+                # Look for basketball indicators
+                is_basketball[ticker] = bool(KEYWORDS_RE.search(market.get('title', '')))
+    
+    # Filter for basketball-related markets
+    basketball_by_term = {
+        term: [m for m in markets_by_term[term] if is_basketball[m.get('ticker')]]
+        for term in search_terms
+    }
+    
+    # Prices for every market shown below, fetched in one batch up front
+    price_error = None
+    try:
+        prices_by_ticker = client.get_market_prices_batch(
+            [m.get('ticker') for markets in basketball_by_term.values() for m in markets[:3]]
+        )
+    except Exception as e:
+        prices_by_ticker, price_error = {}, e
     
     for term in search_terms:
         print(f"\n🔍 Searching for: '{term}'")
-        markets = client.get_markets_by_title(term)
+        markets = markets_by_term[term]
         
         if markets:
             print(f"   Found {len(markets)} markets")
             
-            # Filter for basketball-related markets
-            basketball_markets = []
-            for market in markets:
-                title = market.get('title', '').lower()
-                # Look for basketball indicators
-                if any(keyword in title for keyword in ['basketball', 'ncaa', 'march madness', 'college', 'bracket']):
-                    basketball_markets.append(market)
+            basketball_markets = basketball_by_term[term]
             
             if basketball_markets:
                 print(f"   🏀 Found {len(basketball_markets)} basketball markets:")
@@ -51,11 +78,11 @@ def test_march_madness_markets():
                     # Try to get price
                     ticker = market.get('ticker')
                     if ticker:
-                        try:
-                            yes_price = client._get_yes_price(ticker)
+                        if price_error is None:
+                            yes_price = float(prices_by_ticker.get(ticker, {}).get('yes_buy_price', 0.0))
                             print(f"         YES Price: ${yes_price:.3f}")
-                        except Exception as e:
-                            print(f"         Price: Error - {e}")
+                        else:
+                            print(f"         Price: Error - {price_error}")
                     print()
                 
                 all_markets.extend(basketball_markets)
@@ -66,14 +93,19 @@ def test_march_madness_markets():
         else:
             print("   No markets found")
     
+    # One entry per market, however many terms found it
+    all_markets = list({m.get('ticker'): m for m in all_markets}.values())
+    
     # Summary
     print(f"\n📊 SUMMARY:")
     print(f"   Total basketball markets found: {len(all_markets)}")
     
     if all_markets:
         print(f"\n🏀 ALL BASKETBALL MARKETS:")
-        for i, market in enumerate(all_markets):
-            print(f"   {i+1}. {market.get('ticker', 'N/A')} - {market.get('title', 'N/A')}")
+        print("\n".join(
+            f"   {i}. {market.get('ticker', 'N/A')} - {market.get('title', 'N/A')}"
+            for i, market in enumerate(all_markets, 1)
+        ))
     
     return all_markets
 
@@ -5,8 +5,6 @@ Test the production Kalshi API setup
 
 import os
 
-from kalshi.kalshi_client import KalshiClient
-
 def test_production_setup():
     """Test the production Kalshi API setup"""
     print("🔧 Testing Production Kalshi API Setup...")
@@ -15,9 +13,10 @@ def test_production_setup():
     # Check environment variables
     print("📋 Checking environment variables:")
     
-    key_id = os.getenv('KALSHI_KEY_ID')
-    private_key_path = os.getenv('KALSHI_PRIVATE_KEY_PATH')
-    base_url = os.getenv('KALSHI_BASE_URL')
+    env = os.environ
+    key_id = env.get('KALSHI_KEY_ID')
+    private_key_path = env.get('KALSHI_PRIVATE_KEY_PATH')
+    base_url = env.get('KALSHI_BASE_URL')
     
     print(f"   KALSHI_KEY_ID: {'✅ Set' if key_id else '❌ Missing'}")
     print(f"   KALSHI_PRIVATE_KEY_PATH: {'✅ Set' if private_key_path else '❌ Missing'}")
@@ -41,10 +40,14 @@ def test_production_setup():
     
     print(f"✅ Private key file exists: {private_key_path}")
     
+    # Only imported once the credentials check out: the client pulls in cryptography,
+    # which a misconfigured environment never needs
+    from kalshi.kalshi_client import default_client
+    
     # Initialize client and test preflight
     print("\n🔍 Testing Kalshi client initialization...")
     try:
-        client = KalshiClient()
+        client = default_client()
         print("✅ Kalshi client initialized successfully")
         
         print("\n🚀 Testing preflight check...")
@@ -59,14 +62,16 @@ def test_production_setup():
                 
                 # Show sample markets
                 print("\n🏀 Sample Make Tournament Markets:")
-                for i, market in enumerate(markets[:5]):
-                    ticker = market.get('ticker', 'N/A')
-                    team_name = market.get('team_name', 'N/A')
+                sample = markets[:5]
+                prices_by_ticker = client.get_market_prices_batch([m.ticker for m in sample if m.ticker])
+                for i, market in enumerate(sample):
+                    ticker = market.ticker or 'N/A'
+                    team_name = market.team_name or 'N/A'
                     print(f"   {i+1}. {ticker}")
                     print(f"      Team: {team_name}")
                     
                     # Test price fetching
-                    prices = client.get_market_prices(ticker)
+                    prices = prices_by_ticker.get(ticker, {})
                     yes_buy = prices.get('yes_buy_price')
                     no_buy = prices.get('no_buy_price')
                     
@@ -3,8 +3,24 @@
 Test the regular Kalshi API
 """
 
+import re
+import orjson
 import requests
-import json
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# One keep-alive session so each request after the first skips the TCP/TLS handshake
+SESSION = requests.Session()
+# Transient gateway errors are retried with backoff on the same pooled connection; if
+# they persist, the last response comes back so its status code is still reported
+_RETRY = Retry(total=3, backoff_factor=0.2, status_forcelist=(502, 503, 504),
+               allowed_methods=('GET',), raise_on_status=False)
+SESSION.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=_RETRY))
+
+# Basketball/tournament title keywords, matched case-insensitively in one scan
+KEYWORDS_RE = re.compile(r'basketball|tournament|march madness|ncaa', re.IGNORECASE)
 
 def test_regular_kalshi_api():
     """Test the regular Kalshi API"""
@@ -22,39 +38,43 @@ def test_regular_kalshi_api():
         "/series"
     ]
     
-    for endpoint in endpoints:
-        url = f"{base_url}{endpoint}"
+    # Fire every endpoint request at once, then report in order; a request's
+    # exception resurfaces from result() inside the try below
+    urls = [f"{base_url}{endpoint}" for endpoint in endpoints]
+    with ThreadPoolExecutor(max_workers=len(urls)) as executor:
+        futures = [executor.submit(SESSION.get, url, timeout=10) for url in urls]
+    
+    for url, future in zip(urls, futures):
         print(f"\n📡 Requesting: {url}")
         
         try:
-            response = requests.get(url, timeout=10)
+            response = future.result()
             print(f"📊 Status Code: {response.status_code}")
             
             if response.status_code == 200:
-                data = response.json()
+                data = orjson.loads(response.content)
                 if 'markets' in data:
                     markets = data.get('markets', [])
                     print(f"✅ Found {len(markets)} markets")
                     
                     # Look for basketball/tournament markets
-                    basketball_markets = []
-                    for market in markets[:10]:  # Check first 10
-                        title = market.get('title', '').lower()
-                        if any(keyword in title for keyword in ['basketball', 'tournament', 'march madness', 'ncaa', 'make tournament']):
-                            basketball_markets.append(market)
+                    basketball_markets = [
+                        m for m in islice(markets, 10)  # Check first 10
+                        if KEYWORDS_RE.search(m.get('title', ''))
+                    ]
                     
                     if basketball_markets:
                         print(f"🏀 Found {len(basketball_markets)} basketball markets:")
-                        for i, market in enumerate(basketball_markets[:3]):
-                            print(f"   {i+1}. {market.get('ticker', 'N/A')} - {market.get('title', 'N/A')}")
+                        for i, market in enumerate(islice(basketball_markets, 3), 1):
+                            print(f"   {i}. {market.get('ticker', 'N/A')} - {market.get('title', 'N/A')}")
                             
                             # Get price info
                             ticker = market.get('ticker')
                             if ticker:
                                 price_url = f"{base_url}/markets/{ticker}/price"
-                                price_response = requests.get(price_url)
+                                price_response = SESSION.get(price_url, timeout=10)
                                 if price_response.status_code == 200:
-                                    price_data = price_response.json()
+                                    price_data = orjson.loads(price_response.content)
                                     print(f"      Price: {price_data}")
                     else:
                         print("   No basketball markets found in first 10")